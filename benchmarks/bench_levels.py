@@ -0,0 +1,124 @@
+"""
+Benchmark every level's git workload by replaying a full playthrough.
+
+Each run plays the game headless (--replay) in a fresh temporary directory
+and collects the game's per-lab stats. The results file has p50/p95 wall
+time per lab, run_git calls, bytes of git output and peak RSS, so a
+regression in a level's setup shows up as a number.
+
+    python benchmarks/bench_levels.py --runs 10 --output bench_results.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME = os.path.join(ROOT, "git-quest.py")
+TRANSCRIPT = os.path.join(ROOT, "replays", "full-playthrough.jsonl")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def play_once(transcript):
+    """Replay one playthrough. Returns (lab stats, wall seconds, peak RSS in KB)."""
+    with tempfile.TemporaryDirectory(prefix="git-quest-bench-") as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        log_file = os.path.join(tmp, "replay.log")
+        env = dict(os.environ, HOME=tmp, GIT_QUEST_HOME=tmp)
+        started = time.perf_counter()
+        with open(log_file, "w") as log:
+            proc = subprocess.Popen(
+                [sys.executable, GAME, "--replay", transcript, "--stats", stats_file],
+                cwd=tmp, env=env, stdout=log, stderr=subprocess.STDOUT,
+            )
+            if resource is not None:
+                _, status, usage = os.wait4(proc.pid, 0)
+                failed = status != 0
+                peak_rss = usage.ru_maxrss
+            else:
+                failed = proc.wait() != 0
+                peak_rss = None
+        wall = time.perf_counter() - started
+        if failed:
+            with open(log_file, "r", errors="replace") as log:
+                sys.exit("Replay failed:\n" + log.read()[-2000:])
+        with open(stats_file, "r") as f:
+            return json.load(f)["labs"], wall, peak_rss
+
+
+def summarize(runs):
+    """Fold the per-run lab lists into one p50/p95 row per lab."""
+    labs = []
+    for i, first in enumerate(runs[0]):
+        samples = [run[i] for run in runs]
+        seconds = [lab["seconds"] for lab in samples]
+        git_seconds = [lab["git_seconds"] for lab in samples]
+        labs.append({
+            "lab": first["lab"],
+            "p50_seconds": percentile(seconds, 50),
+            "p95_seconds": percentile(seconds, 95),
+            "p50_git_seconds": percentile(git_seconds, 50),
+            "git_calls": max(lab["git_calls"] for lab in samples),
+            "git_bytes": max(lab["git_bytes"] for lab in samples),
+            "subprocesses": max(lab["subprocesses"] for lab in samples),
+        })
+    return labs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark The Git Quest level by level.")
+    parser.add_argument("--runs", type=int, default=5, help="playthroughs to replay (default 5)")
+    parser.add_argument("--transcript", default=TRANSCRIPT, help="JSONL transcript to replay")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the results")
+    args = parser.parse_args()
+
+    runs, walls, rss = [], [], []
+    for n in range(1, args.runs + 1):
+        labs, wall, peak_rss = play_once(os.path.abspath(args.transcript))
+        runs.append(labs)
+        walls.append(wall)
+        if peak_rss is not None:
+            rss.append(peak_rss)
+        print(f"  run {n}/{args.runs}: {wall:.3f}s")
+
+    if any(len(run) != len(runs[0]) for run in runs):
+        sys.exit("Runs visited a different number of labs; is the transcript deterministic?")
+
+    labs = summarize(runs)
+    results = {
+        "runs": args.runs,
+        "transcript": os.path.relpath(os.path.abspath(args.transcript), ROOT),
+        "p50_wall_seconds": percentile(walls, 50),
+        "p95_wall_seconds": percentile(walls, 95),
+        "peak_rss_kb": max(rss) if rss else None,
+        "labs": labs,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n  {'LAB':<52} {'P50':>7} {'P95':>7} {'GIT':>7} {'CALLS':>5} {'BYTES':>7}")
+    for lab in labs:
+        print(f"  {lab['lab']:<52} {lab['p50_seconds']:>7.3f} {lab['p95_seconds']:>7.3f} "
+              f"{lab['p50_git_seconds']:>7.3f} {lab['git_calls']:>5} {lab['git_bytes']:>7}")
+    print(f"\n  Whole playthrough: p50 {results['p50_wall_seconds']:.3f}s, "
+          f"p95 {results['p95_wall_seconds']:.3f}s, peak RSS {results['peak_rss_kb']} KB")
+    print(f"  Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3838 @@
+"""
+THE GIT QUEST - An Interactive Terminal Game to Learn Git
+Run this and follow along. It teaches you Git by making you DO things.
+
+Started through the git-quest.py launcher so the bytecode gets cached.
+"""
+
+import os
+import sys
+import io
+import subprocess
+import time
+import shutil
+import shlex
+import json
+import math
+import atexit
+import struct
+import functools
+import threading
+import argparse
+
+# ─── COLORS ─────────────────────────────────────────────
+class C:
+    GOLD = "\033[93m"
+    GREEN = "\033[92m"
+    RED = "\033[91m"
+    BLUE = "\033[94m"
+    CYAN = "\033[96m"
+    MAGENTA = "\033[95m"
+    DIM = "\033[90m"
+    BOLD = "\033[1m"
+    RESET = "\033[0m"
+
+# ─── GAME STATE ─────────────────────────────────────────
+class Session:
+    """One player's progress and quest repo, saved and restored as a unit.
+
+    This is not enough for several players to share a process: the repo
+    snapshot, git_file_cache, the prefetch state, counters and lab_stats
+    are still module globals, and `session` below is the one instance
+    the game uses.
+    """
+    def __init__(self):
+        self.xp = 0
+        self.achievements = []
+        self.current_level = 1
+        self.current_lab = 0
+        self.quest_dir = None
+
+session = Session()
+DATA_DIR = os.environ.get("GIT_QUEST_HOME") or os.path.dirname(os.path.abspath(__file__))
+SAVE_FILE = os.path.join(DATA_DIR, "git_quest_save.json")
+CHECKPOINT_DIR = os.path.join(DATA_DIR, "git_quest_checkpoints")
+BASE_REPO = os.path.join(CHECKPOINT_DIR, "checkpoints.git")
+CHECKPOINT_CACHE_MB = 50
+DRILL_DIR = os.path.join(DATA_DIR, "git_quest_drills")
+# `git config --global` in the labs writes here, never to the player's own config
+GIT_CONFIG_FILE = os.path.join(DATA_DIR, "git_quest.gitconfig")
+
+# Resolved on the first run_git call, then reused to skip the PATH lookup.
+# GIT_OPTIONAL_LOCKS=0 stops read-only commands like `git status` from
+# taking index.lock to opportunistically rewrite the index. The labs all
+# say main, so a plain `git init` typed in --real mode must make main too.
+# Git never gets to open an editor: a typed `git commit` with no -m would
+# otherwise sit in one, unseen, until the call times out.
+GIT = None
+GIT_ENV = dict(os.environ, GIT_OPTIONAL_LOCKS="0", GIT_CONFIG_GLOBAL=GIT_CONFIG_FILE,
+               GIT_EDITOR="true", GIT_SEQUENCE_EDITOR="true",
+               GIT_CONFIG_COUNT="1", GIT_CONFIG_KEY_0="init.defaultBranch", GIT_CONFIG_VALUE_0="main")
+
+# Scenario commits are written with a fixed identity and clock, and with no
+# system/global config or hooks, so the same scenario on the same parent
+# always produces the same commit ids.
+SEED_AUTHOR = "Git Quest <quest@git-quest.example>"
+SARAH = "Sarah <sarah@git-quest.example>"
+SEED_EPOCH = 1704067200     # 2024-01-01 00:00 UTC, where drill histories start
+SEED_ENV = dict(GIT_ENV, GIT_CONFIG_NOSYSTEM="1", GIT_CONFIG_GLOBAL=os.devnull,
+                GIT_CONFIG_COUNT="1", GIT_CONFIG_KEY_0="core.hooksPath", GIT_CONFIG_VALUE_0=os.devnull)
+
+# ─── INSTRUMENTATION ───────────────────────────────────
+# Session-wide counters. Hot helpers add to them with count() (run_git, the
+# file helpers); any other helper can be timed by wrapping it with @timed.
+# Labs are measured as counter deltas between banners, and with --trace each
+# finished lab is appended to a JSON-lines file. Git work done in the
+# background is counted apart (prefetch_*), so a lab's git time is its own.
+counters = {"subprocesses": 0, "git_calls": 0, "git_bytes": 0, "git_seconds": 0.0,
+            "input_seconds": 0.0, "render_seconds": 0.0,
+            "file_bytes_read": 0, "file_bytes_written": 0,
+            "prefetch_git_calls": 0, "prefetch_git_seconds": 0.0}
+counters_lock = threading.Lock()    # for counters written from other threads
+lab_stats = []          # one entry per banner() shown, when replaying or tracing
+trace_file = None       # --trace: where finished labs are appended as JSON lines
+trace_session = {}      # player and session id stamped on every trace line
+
+def count(**amounts):
+    """Add to the named counters. Background threads count too, so this takes the lock."""
+    with counters_lock:
+        for key, amount in amounts.items():
+            counters[key] += amount
+
+def timed(counter):
+    """Decorator: add the wrapped helper's wall time to counters[counter]."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def timed_fn(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                count(**{counter: time.perf_counter() - started})
+        return timed_fn
+    return wrap
+
+def start_lab(title):
+    """Close the running lab's stats and open a new entry for `title`."""
+    now = time.perf_counter()
+    with counters_lock:
+        totals = dict(counters)
+    if lab_stats:
+        lab = lab_stats[-1]
+        lab["seconds"] = now - lab.pop("started")
+        at_start = lab.pop("at_start")
+        for key, value in totals.items():
+            lab[key] = value - at_start[key]
+        if trace_file:
+            write_trace(dict(event="lab", **lab))
+    if profile_dir:
+        profile_lab(title)
+    lab_stats.append({"lab": title, "started": now, "at_start": totals})
+
+def finish_lab_stats():
+    start_lab(None)
+    lab_stats.pop()
+
+def report_lab_stats():
+    print(f"\n{C.BOLD}  {'LAB':<52} {'SECONDS':>8} {'IN GIT':>8} {'PROCS':>6}{C.RESET}")
+    for lab in lab_stats:
+        print(f"  {lab['lab']:<52} {lab['seconds']:>8.3f} {lab['git_seconds']:>8.3f} {lab['subprocesses']:>6}")
+    total = sum(lab["seconds"] for lab in lab_stats)
+    print(f"  {'TOTAL':<52} {total:>8.3f} {counters['git_seconds']:>8.3f} {counters['subprocesses']:>6}")
+
+def write_lab_stats(path):
+    with open(path, "w") as f:
+        json.dump({"labs": lab_stats, "totals": counters}, f, indent=2)
+
+def start_trace(path):
+    """Trace this session to `path`: a line per finished lab, and the totals on exit."""
+    global trace_file
+    import getpass
+    trace_file = path
+    try:
+        trace_session["player"] = getpass.getuser()
+    except Exception:   # no USER/LOGNAME and no passwd entry
+        trace_session["player"] = "unknown"
+    trace_session["session"] = f"{int(time.time())}-{os.getpid()}"
+    atexit.register(finish_trace)
+
+def finish_trace():
+    if lab_stats and "started" in lab_stats[-1]:
+        finish_lab_stats()
+    with counters_lock:
+        totals = dict(counters)
+    write_trace(dict(event="session", **totals))
+
+def write_trace(record):
+    with open(trace_file, "a") as f:
+        f.write(json.dumps(dict(trace_session, **record)) + "\n")
+
+# ─── PROFILER ──────────────────────────────────────────
+# --profile DIR: each lab (from one banner() to the next) gets its own
+# cProfile dump, plus collapsed stacks from a thread that samples the game
+# every few ms, ready for flamegraph.pl or speedscope. The samples are wall
+# clock, so time spent sleeping in slow_print or waiting on git shows up.
+SAMPLE_SECONDS = 0.005
+profile_dir = None
+profiles = []           # every lab's cProfile.Profile, for the summary
+lab_stacks = []         # every lab's {stack: samples}, for all.folded
+profiling = None        # (index, title, profile, {stack: samples}) of the running lab
+profiling_lock = threading.Lock()   # the sampler thread adds to the running lab's stacks
+
+def start_profile(path):
+    global profile_dir
+    profile_dir = path
+    os.makedirs(path, exist_ok=True)
+    import glob
+    for stale in glob.glob(os.path.join(path, "[0-9][0-9]-*.prof")) + glob.glob(os.path.join(path, "[0-9][0-9]-*.folded")):
+        os.remove(stale)    # a shorter earlier run's labs would read as this run's
+    profile_lab("menu")
+    threading.Thread(target=sample_stacks, args=(threading.main_thread().ident,), daemon=True).start()
+    atexit.register(finish_profile)
+
+def profile_lab(title):
+    """Write the running lab's profile and stacks, then start profiling `title` (None: stop)."""
+    global profiling
+    import cProfile
+    with profiling_lock:
+        running, profiling = profiling, None
+    index = 0
+    if running:
+        index, old_title, profile, stacks = running
+        profile.disable()
+        name = os.path.join(profile_dir, f"{index:02d}-{profile_slug(old_title)}")
+        profile.dump_stats(name + ".prof")
+        write_folded(name + ".folded", stacks)
+        profiles.append(profile)
+        lab_stacks.append(stacks)
+        index += 1
+    if title is not None:
+        profile = cProfile.Profile()
+        with profiling_lock:
+            profiling = (index, title, profile, {})
+        profile.enable()
+
+def profile_slug(title):
+    import re
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "lab"
+
+def sample_stacks(thread_id):
+    while True:
+        time.sleep(SAMPLE_SECONDS)
+        frame = sys._current_frames().get(thread_id)
+        if frame is None or profiling is None:
+            continue
+        names = []
+        while frame is not None:
+            names.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        stack = ";".join(reversed(names))
+        with profiling_lock:
+            if profiling:   # the lab may have been closed meanwhile
+                stacks = profiling[3]
+                stacks[stack] = stacks.get(stack, 0) + 1
+
+def write_folded(path, stacks):
+    with open(path, "w") as f:
+        for stack, samples in sorted(stacks.items()):
+            f.write(f"{stack} {samples}\n")
+
+def finish_profile():
+    """Close the last lab, merge every lab's stacks and print the functions that cost the most."""
+    import pstats
+    profile_lab(None)
+    merged = {}
+    for stacks in lab_stacks:
+        for stack, samples in stacks.items():
+            merged[stack] = merged.get(stack, 0) + samples
+    write_folded(os.path.join(profile_dir, "all.folded"), merged)
+    if not profiles:
+        return
+    with open(os.path.join(profile_dir, "summary.txt"), "w") as f:
+        stats = pstats.Stats(*profiles, stream=f)
+        stats.sort_stats("tottime").print_stats(40)
+        stats.sort_stats("cumulative").print_stats(40)
+
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:15]
+    print(f"\n{C.BOLD}  {'FUNCTION':<52} {'CALLS':>7} {'OWN':>8} {'TOTAL':>8}{C.RESET}")
+    for (filename, line, func), (_, calls, own, total, _) in rows:
+        where = f"{os.path.basename(filename)}:{func}" if line else func
+        print(f"  {where[:52]:<52} {calls:>7} {own:>8.3f} {total:>8.3f}")
+    print(f"  Per-lab .prof and .folded files, all.folded and summary.txt are in {profile_dir}")
+    sys.stdout.flush()
+
+# ─── HEADLESS REPLAY ────────────────────────────────────
+replay_inputs = None    # iterator over transcript answers when headless
+
+def load_replay(path):
+    """Read a JSONL transcript: one {"input": "..."} object per prompt."""
+    global replay_inputs
+    with open(path, "r") as f:
+        answers = [json.loads(line)["input"] for line in f if line.strip()]
+    replay_inputs = iter(answers)
+
+def replay_expect(condition, message):
+    """Under --replay, stop with an error unless `condition` holds, so a transcript doubles as a test."""
+    if replay_inputs is not None and not condition:
+        sys.exit(f"\nReplay check failed: {message}")
+
+def read_input(prompt):
+    if replay_inputs is None:
+        draw()
+        return wait_for_player(prompt)
+    try:
+        answer = next(replay_inputs)
+    except StopIteration:
+        sys.exit(f"\nReplay transcript ran out at prompt: {prompt.strip()}")
+    print(f"{prompt}{answer}")
+    return answer
+
+@timed("render_seconds")
+def draw():
+    """Send the screen built so far to the terminal."""
+    sys.stdout.flush()
+
+@timed("input_seconds")
+def wait_for_player(prompt):
+    return input(prompt)
+
+# ─── HELPERS ────────────────────────────────────────────
+fast_text = False       # --fast or headless: no typewriter effect, no dramatic sleeps
+real_mode = False       # --real: typed git commands run as typed instead of the canned step
+FRAME_BYTES = 64 * 1024
+FRAME_SECONDS = 1 / 30
+
+def buffer_screen_output():
+    """Send each screen to the terminal in one write instead of one per line.
+
+    Output is held until the game waits for the player (input() flushes
+    stdout first) or hands the terminal to another program.
+    """
+    if os.name == "nt":
+        return  # keep the console's own Unicode-aware stdout
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    sys.stdout.flush()
+    sys.stdout = io.open(os.dup(fd), "w", buffering=FRAME_BYTES,
+                         encoding=sys.stdout.encoding, errors=sys.stdout.errors)
+
+# Screen control is plain ANSI written to stdout, so clearing between labs
+# costs no process. Old Windows consoles that refuse VT mode fall back to cls.
+ANSI_CLEAR = "\033[H\033[2J\033[3J"     # home, erase screen, erase scrollback
+ALT_SCREEN_ON = "\033[?1049h"
+ALT_SCREEN_OFF = "\033[?1049l"
+ansi_ok = os.name != "nt"
+on_alt_screen = False
+
+def enable_ansi():
+    """Turn on escape sequence handling in the Windows console. A no-op elsewhere."""
+    global ansi_ok
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)     # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            ansi_ok = bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        ansi_ok = False
+
+def use_alt_screen():
+    """Play on the terminal's alternate screen and give the shell its screen back on exit.
+
+    A crash leaves it before the traceback is printed, so the traceback stays readable.
+    """
+    global on_alt_screen
+    if not ansi_ok or not sys.stdout.isatty():
+        return
+    sys.stdout.write(ALT_SCREEN_ON)
+    on_alt_screen = True
+    atexit.register(leave_alt_screen)
+    default_hook = sys.excepthook
+    def leave_then_report(*exc_info):
+        leave_alt_screen()
+        default_hook(*exc_info)
+    sys.excepthook = leave_then_report
+
+def leave_alt_screen():
+    """Back to the shell's own screen: what is printed after this stays there once the game exits."""
+    global on_alt_screen
+    if not on_alt_screen:
+        return
+    on_alt_screen = False
+    sys.stdout.write(ALT_SCREEN_OFF)
+    sys.stdout.flush()
+
+@timed("render_seconds")
+def clear():
+    if replay_inputs is None:
+        if ansi_ok:
+            sys.stdout.write(ANSI_CLEAR)
+        else:
+            sys.stdout.flush()
+            os.system("cls")
+
+def pause(msg="Press ENTER to continue..."):
+    prefetch_upcoming()
+    if replay_inputs is None:
+        draw()
+        wait_for_player(f"\n{C.DIM}{msg}{C.RESET}")
+
+def suspense(seconds):
+    """A dramatic beat while the game 'simulates' something. Skipped in fast text mode."""
+    if not fast_text:
+        sys.stdout.flush()
+        time.sleep(seconds)
+
+@timed("render_seconds")
+def slow_print(text, delay=0.02):
+    """Typewriter effect, drawn in frames: each frame writes every character due by then."""
+    if fast_text:
+        print(text)
+        return
+    shown = 0
+    started = time.perf_counter()
+    while shown < len(text):
+        time.sleep(FRAME_SECONDS)
+        due = min(len(text), int((time.perf_counter() - started) / delay) + 1)
+        sys.stdout.write(text[shown:due])
+        sys.stdout.flush()
+        shown = due
+    print()
+
+def banner(text):
+    if replay_inputs is not None or trace_file or profile_dir:
+        start_lab(text)
+    width = 50
+    print(f"\n{C.GOLD}{'═' * width}")
+    print(f"  {text}")
+    print(f"{'═' * width}{C.RESET}\n")
+
+def show_xp():
+    print(f"\n{C.GOLD}⭐ Total XP: {session.xp}{C.RESET}")
+
+def award_xp(amount, reason):
+    session.xp += amount
+    print(f"\n{C.GREEN}  +{amount} XP! {reason}{C.RESET}")
+
+def achievement(name):
+    session.achievements.append(name)
+    print(f"\n{C.MAGENTA}  🏅 ACHIEVEMENT UNLOCKED: {name}!{C.RESET}")
+
+def mission(text):
+    print(f"\n{C.CYAN}  🎯 MISSION: {text}{C.RESET}\n")
+
+def story(text):
+    print(f"\n{C.DIM}  {text}{C.RESET}")
+
+def instruction(text):
+    print(f"\n{C.BOLD}  👉 {text}{C.RESET}")
+
+def success(text):
+    print(f"\n{C.GREEN}  ✅ {text}{C.RESET}")
+
+def fail(text):
+    print(f"\n{C.RED}  ❌ {text}{C.RESET}")
+
+def hint(text):
+    print(f"\n{C.DIM}  💡 Hint: {text}{C.RESET}")
+
+def show_command(cmd):
+    print(f"\n  {C.GOLD}$  {cmd}{C.RESET}")
+
+def wait_for_command(prompt_text="Type the command and press ENTER: "):
+    return read_input(f"\n  {C.CYAN}⌨  {prompt_text}{C.RESET}").strip()
+
+last_expect = None      # (matcher, hint) of the last prompt, for play() to ask again
+
+def expect(matcher, hint_text):
+    """Prompt until the typed command matches, hinting after each miss. Returns the command.
+
+    `matcher` is either the exact command as a string or a function of the
+    typed command returning True when it is accepted.
+    """
+    global last_expect
+    last_expect = (matcher, hint_text)
+    while True:
+        cmd = wait_for_command()
+        if cmd == matcher if isinstance(matcher, str) else matcher(cmd):
+            return cmd
+        hint(hint_text)
+
+def run_typed_git(cmd, **kwargs):
+    """Run the git command the player typed: split like a shell would, run without one."""
+    try:
+        argv = shlex.split(cmd)
+    except ValueError as e:
+        return False, f"Couldn't read that command: {e}"
+    if not argv or argv[0] != "git":
+        return False, "Only git commands run here."
+    if len(argv) == 1:
+        return False, "That's just `git`. Type the whole command."
+    sys.stdout.flush()      # anything typed may prompt on the terminal
+    return run_git(*argv[1:], **kwargs)
+
+def run_typed_command(cmd):
+    """Run the player's command and show what it printed. Returns True if it worked."""
+    ok, out = run_typed_git(cmd)
+    if ok:
+        if out:
+            print(out)
+    else:
+        fail(out or "That command failed.")
+    return ok
+
+def play(cmd, *args, check=None, may_fail=False, **kwargs):
+    """Carry out a lab step: the player's own command in --real mode, the lab's canned run_git(*args) otherwise.
+
+    In --real mode the step must also work: if the command fails (unless
+    `may_fail`) or `check()` says the repo isn't where the step leads, the
+    output is shown and the player is asked again.
+    """
+    if not real_mode:
+        return run_git(*args, **kwargs)
+    while True:
+        if not cmd.startswith("git "):
+            return run_git(*args, **kwargs)
+        ok, out = run_typed_git(cmd, **kwargs)
+        if (ok or may_fail) and (check is None or check()):
+            return ok, out
+        if out:
+            print(f"\n  {C.DIM}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+        if ok or may_fail:
+            fail("That ran, but the repo isn't where this step needs it. Try again.")
+        else:
+            fail("That command failed. Read what git said and try again.")
+        cmd = expect(*last_expect)
+
+# Step checks for play(check=...): each returns a function that says
+# whether the repo got where the step was meant to take it.
+def on_branch(name):
+    return lambda: read_head()[0] == name
+
+def staged(*filenames):
+    return lambda: all(name in repo_snapshot().staged for name in filenames)
+
+def head_moved():
+    """True once HEAD points somewhere other than where it points now."""
+    before = read_head()[1]
+    return lambda: read_head()[1] != before
+
+def merged(branch):
+    return lambda: run_git("merge-base", "--is-ancestor", branch, "HEAD")[0]
+
+def has_ref(ref):
+    return lambda: resolve_ref(ref) is not None
+
+def lacks_ref(ref):
+    return lambda: resolve_ref(ref) is None
+
+def ensure_git_config():
+    """Create the quest's global git config, layered over the player's real one.
+
+    Reads still see the player's settings (credentials for the push lab,
+    for one) through [include]. Writes land only in GIT_CONFIG_FILE, or in
+    a temporary file for this session when DATA_DIR can't be written.
+    """
+    if os.path.exists(GIT_CONFIG_FILE):
+        return
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    includes = [os.path.join(xdg, "git", "config"), os.path.join(os.path.expanduser("~"), ".gitconfig")]
+    header = "# Written by The Git Quest. `git config --global` in the labs lands here.\n[include]\n"
+    content = header + "".join(f"\tpath = {path.replace(os.sep, '/')}\n" for path in includes)
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(GIT_CONFIG_FILE, "w") as f:
+            f.write(content)
+        return
+    except OSError as e:
+        error = e
+    import tempfile
+    try:
+        fd, path = tempfile.mkstemp(prefix="git_quest-", suffix=".gitconfig")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+    except OSError:
+        # No writable place at all: let git use the player's own global config
+        del GIT_ENV["GIT_CONFIG_GLOBAL"]
+        print(f"  Can't write {GIT_CONFIG_FILE} ({error.strerror}); "
+              f"`git config --global` in the labs will change your own git config.", file=sys.stderr)
+        return
+    GIT_ENV["GIT_CONFIG_GLOBAL"] = path
+    atexit.register(os.remove, path)
+    print(f"  Can't write {GIT_CONFIG_FILE} ({error.strerror}); "
+          f"this session's `git config --global` settings go to {path}.", file=sys.stderr)
+
+def run_git(*args, cwd=None, input=None, timeout=10, env=None):
+    """Run a git command and return (success, output).
+
+    Ctrl+C while git is running cancels just that command, so a stuck
+    network call hands control back to the lab instead of killing the game.
+    Long-running calls get the buffered screen flushed first, since git may
+    ask for credentials on the terminal while they run.
+    """
+    global snapshot
+    if args[0] not in READ_ONLY_GIT:
+        snapshot = None
+    if timeout > 10:
+        sys.stdout.flush()
+    count(subprocesses=1, git_calls=1)
+    started = time.perf_counter()
+    try:
+        ok, out, size = git_process(args, cwd=cwd or session.quest_dir, input=input, timeout=timeout, env=env)
+        count(git_bytes=size)
+        return ok, out
+    except KeyboardInterrupt:
+        return False, f"git {args[0]} cancelled."
+    except Exception as e:
+        return False, str(e)
+    finally:
+        count(git_seconds=time.perf_counter() - started)
+
+def git_process(args, cwd, input=None, timeout=10, env=None):
+    """Run git and return (success, output, bytes of output).
+
+    Leaves the counters and the snapshot alone, so background threads can
+    call it; run_git is this plus the bookkeeping.
+    """
+    global GIT
+    if GIT is None:
+        GIT = shutil.which("git") or "git"
+    result = subprocess.run(
+        [GIT] + list(args),
+        cwd=cwd, env=env or GIT_ENV, input=input,
+        stdin=None if input is not None else subprocess.DEVNULL,
+        capture_output=True, text=True, timeout=timeout
+    )
+    size = len(result.stdout.encode()) + len(result.stderr.encode())
+    return result.returncode == 0, result.stdout.strip() + result.stderr.strip(), size
+
+def check_file_exists(filename):
+    if session.quest_dir:
+        return os.path.exists(os.path.join(session.quest_dir, filename))
+    return False
+
+def read_file(filename):
+    path = os.path.join(session.quest_dir, filename)
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            content = f.read()
+        count(file_bytes_read=len(content.encode()))
+        return content.strip()
+    return ""
+
+def write_file(filename, content):
+    global snapshot
+    snapshot = None
+    path = os.path.join(session.quest_dir, filename)
+    with open(path, "w") as f:
+        f.write(content)
+    count(file_bytes_written=len(content.encode()))
+
+def append_file(filename, content):
+    global snapshot
+    snapshot = None
+    path = os.path.join(session.quest_dir, filename)
+    with open(path, "a") as f:
+        f.write(content)
+    count(file_bytes_written=len(content.encode()))
+
+def delete_file(filename):
+    global snapshot
+    snapshot = None
+    path = os.path.join(session.quest_dir, filename)
+    if os.path.exists(path):
+        os.remove(path)
+
+def get_current_branch():
+    return read_head()[0]
+
+def get_commit_count():
+    ok, out = run_git("rev-list", "--count", "HEAD")
+    try:
+        return int(out.strip()) if ok else 0
+    except:
+        return 0
+
+def is_git_repo():
+    return session.quest_dir and os.path.isdir(os.path.join(session.quest_dir, ".git"))
+
+def get_branches():
+    return list_refs("refs/heads/")
+
+def has_conflict():
+    return any(stage for stages in read_index().values() for stage in stages)
+
+def fast_import_data(text):
+    """Encode text as a delimited `data` block for git fast-import."""
+    return f"data <<END_OF_QUEST_DATA\n{text}\nEND_OF_QUEST_DATA\n"
+
+def seed_commits(commits, author=SEED_AUTHOR):
+    """Append scripted commits to the current branch in one go.
+
+    `commits` is a list of (message, {filename: content}) pairs. The whole
+    history is written by a single `git fast-import`, then the index and
+    working tree are moved forward to match, instead of a write/add/commit
+    round-trip per commit. `author` is used for both author and committer,
+    and each commit is dated a minute after its parent, so the same
+    scenario on the same parent always gives the same commits.
+    """
+    branch, head = read_head()
+    if not head or not branch:
+        return False
+    ref = "refs/heads/" + branch
+
+    tip = take_prefetched(commits, head)
+    if tip:
+        # Built in the background already; move the branch only if it still points at head.
+        ok, out = run_git("update-ref", ref, tip, head, env=SEED_ENV)
+    else:
+        stream = seed_stream(ref, head, commit_time(head), commits, author)
+        ok, out = run_git("fast-import", "--quiet", "--done", input=stream, env=SEED_ENV)
+    if not ok:
+        return False
+    ok, out = run_git("read-tree", "-m", "-u", head, "HEAD", env=SEED_ENV)
+    return ok
+
+def commit_time(commit, cwd=None):
+    """Committer time of `commit`, in seconds since the epoch. 0 if git can't tell."""
+    ok, out = run_git("show", "-s", "--format=%ct", commit, cwd=cwd)
+    return int(out) if ok and out.isdigit() else 0
+
+def seed_stream(ref, parent, parent_time, commits, author):
+    """The fast-import stream that writes `commits` onto `ref` on top of `parent`.
+
+    Commit i is dated i + 1 minutes after `parent_time`. The stream ends by
+    printing the id of the last commit.
+    """
+    stream = []
+    for i, (message, files) in enumerate(commits):
+        ident = f"{author} {parent_time + 60 * (i + 1)} +0000"
+        stream.append(f"commit {ref}\nmark :{i + 1}\nauthor {ident}\ncommitter {ident}\n")
+        stream.append(fast_import_data(message))
+        if i == 0:
+            stream.append(f"from {parent}\n")
+        for filename, content in files.items():
+            stream.append(f"M 100644 inline {filename}\n")
+            stream.append(fast_import_data(content))
+        stream.append("\n")
+    stream.append(f"get-mark :{len(commits)}\ndone\n")
+    return "".join(stream)
+
+# ─── FIXTURE PREFETCH ──────────────────────────────────
+# Every history a lab seeds grows from main. While the player reads the
+# end of one lab, the next lab's history is built on main's tip in the
+# background, so seeding it later is one ref update instead of an import.
+PREFETCH_REF = "QUEST_PREFETCH"     # outside refs/, so `git log --all` never lists it
+upcoming = None         # (commits, author) the next lab seeds, set by the main loop
+prefetch_job = None     # (commits, parent, future tip) of the last build started
+prefetch_pool = None
+
+def prefetch_upcoming():
+    """Start building the next lab's history on main, unless that's already under way."""
+    global prefetch_job, prefetch_pool
+    parent = resolve_ref("refs/heads/main")
+    if upcoming is None or not parent:
+        return
+    commits, author = upcoming
+    if prefetch_job and prefetch_job[0] is commits and prefetch_job[1] == parent:
+        return
+    if prefetch_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        prefetch_pool = ThreadPoolExecutor(1)
+    future = prefetch_pool.submit(build_prefetch, commits, author, parent, session.quest_dir)
+    prefetch_job = (commits, parent, future)
+
+def build_prefetch(commits, author, parent, quest_dir):
+    """Write `commits` on top of `parent` without moving any branch. Returns the tip, or None.
+
+    This runs on the prefetch thread, so it calls git_process directly and
+    counts its git work as prefetch_*, not as the running lab's.
+    """
+    started = time.perf_counter()
+    calls = 0
+    try:
+        calls += 1
+        ok, out, _ = git_process(("show", "-s", "--format=%ct", parent), cwd=quest_dir)
+        parent_time = int(out) if ok and out.isdigit() else 0
+        stream = seed_stream(PREFETCH_REF, parent, parent_time, commits, author)
+        calls += 1
+        ok, out, _ = git_process(("fast-import", "--quiet", "--done"), cwd=quest_dir, input=stream, env=SEED_ENV)
+    except Exception:
+        ok = False
+    finally:
+        count(prefetch_git_calls=calls, prefetch_git_seconds=time.perf_counter() - started)
+    try:
+        os.remove(os.path.join(quest_dir, ".git", PREFETCH_REF))
+    except OSError:
+        pass
+    return out if ok else None
+
+def take_prefetched(commits, parent):
+    """The prebuilt tip of `commits` on `parent`, waiting for it if needed. None if there isn't one."""
+    global prefetch_job
+    job, prefetch_job = prefetch_job, None
+    if job is None or job[0] is not commits or job[1] != parent:
+        return None
+    return job[2].result()
+
+# ─── REPO SNAPSHOT ─────────────────────────────────────
+# Git subcommands that never change the repo, so they keep the snapshot.
+READ_ONLY_GIT = {"status", "log", "diff", "show", "blame", "shortlog", "reflog",
+                 "rev-parse", "rev-list", "for-each-ref", "var", "cat-file"}
+
+class RepoSnapshot:
+    """File states of the quest repo at one moment, from one `git status`.
+
+    HEAD, refs and the index are cheaper from the repo reader below; this
+    is for what only git can work out, like untracked or modified files.
+    """
+    def __init__(self):
+        self.staged = set()
+        self.modified = set()   # changed in the working tree, not staged
+        self.untracked = set()
+
+snapshot = None     # dropped by anything that may change the repo
+
+def repo_snapshot():
+    """Return the cached RepoSnapshot, refreshing it with one git call if stale."""
+    global snapshot
+    if snapshot is not None:
+        return snapshot
+    snap = RepoSnapshot()
+    ok, out = run_git("status", "--porcelain=v2")
+    if ok:
+        for line in out.split("\n"):
+            if line[:2] in ("1 ", "2 "):
+                # Renames ("2") carry an extra score field and "path<TAB>orig_path".
+                fields = line.split(" ", 8 if line[0] == "1" else 9)
+                xy, path = fields[1], fields[-1].split("\t")[0]
+                if xy[0] != ".":
+                    snap.staged.add(path)
+                if xy[1] != ".":
+                    snap.modified.add(path)
+            elif line.startswith("? "):
+                snap.untracked.add(line[2:])
+    snapshot = snap
+    return snap
+
+# ─── REPO READER ───────────────────────────────────────
+# Validators read HEAD, refs and the index straight from .git: no git
+# process, and each parsed file is reused until its mtime, size or inode
+# changes (git replaces these files by renaming a lock file over them).
+git_file_cache = {}
+
+def read_git_file(name, parse):
+    """Return parse(bytes of .git/`name`), cached while the file is unchanged. None if missing."""
+    if not session.quest_dir:
+        return None
+    path = os.path.join(session.quest_dir, ".git", name)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = git_file_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        value = parse(f.read())
+    git_file_cache[path] = (key, value)
+    return value
+
+def parse_text(data):
+    return data.decode().strip()
+
+def parse_packed_refs(data):
+    refs = {}
+    for line in data.decode().splitlines():
+        if line and line[0] not in "#^":
+            oid, name = line.split(" ", 1)
+            refs[name] = oid
+    return refs
+
+def resolve_ref(ref):
+    """Commit id a ref points at, from its loose file or packed-refs. None if it doesn't exist."""
+    loose = read_git_file(ref, parse_text)
+    if loose:
+        return loose
+    return (read_git_file("packed-refs", parse_packed_refs) or {}).get(ref)
+
+def read_head():
+    """(branch, commit) of HEAD. branch is "" when detached, commit None before the first commit."""
+    head = read_git_file("HEAD", parse_text)
+    if not head:
+        return "", None
+    if not head.startswith("ref: "):
+        return "", head
+    ref = head[len("ref: "):]
+    branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ""
+    return branch, resolve_ref(ref)
+
+def list_refs(prefix):
+    """Sorted ref names under `prefix` (e.g. "refs/heads/"), loose and packed, prefix removed."""
+    packed = read_git_file("packed-refs", parse_packed_refs) or {}
+    names = set(name[len(prefix):] for name in packed if name.startswith(prefix))
+    root = os.path.join(session.quest_dir, ".git", prefix)
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith(".lock"):
+                names.add(os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, "/"))
+    return sorted(names)
+
+def parse_index(data):
+    """Map each path in an index file (versions 2-4) to {stage: blob id}.
+
+    Stage 0 is a normal entry; stages 1-3 are the base/ours/theirs sides
+    of an unresolved merge conflict.
+    """
+    if len(data) < 12:
+        return {}
+    signature, version, count = struct.unpack(">4sLL", data[:12])
+    if signature != b"DIRC" or version not in (2, 3, 4):
+        return {}
+    entries = {}
+    pos, previous = 12, b""
+    for _ in range(count):
+        start = pos
+        oid = data[pos + 40:pos + 60].hex()
+        flags = struct.unpack(">H", data[pos + 60:pos + 62])[0]
+        pos += 62
+        if version >= 3 and flags & 0x4000:    # extended flags
+            pos += 2
+        if version == 4:
+            # The path is prefix-compressed against the previous entry's.
+            byte = data[pos]
+            pos += 1
+            strip = byte & 0x7f
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                strip = ((strip + 1) << 7) | (byte & 0x7f)
+            end = data.index(b"\0", pos)
+            path = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            end = data.index(b"\0", pos)
+            path = data[pos:end]
+            # Entries are NUL-padded to a multiple of 8 bytes.
+            pos = start + ((end - start + 8) & ~7)
+        previous = path
+        entries.setdefault(path.decode(errors="replace"), {})[(flags >> 12) & 3] = oid
+    return entries
+
+def read_index():
+    return read_git_file("index", parse_index) or {}
+
+# ─── SAVE / LOAD SYSTEM ────────────────────────────────
+def save_progress():
+    """Write the save file atomically: a crash leaves the old or the new file, never half of one."""
+    data = {
+        "xp": session.xp,
+        "achievements": session.achievements,
+        "current_level": session.current_level,
+        "current_lab": session.current_lab,
+    }
+    tmp = SAVE_FILE + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, SAVE_FILE)
+    except OSError:
+        pass
+
+def load_progress():
+    if os.path.exists(SAVE_FILE):
+        try:
+            with open(SAVE_FILE, "r") as f:
+                data = json.load(f)
+            session.xp = data.get("xp", 0)
+            session.achievements = data.get("achievements", [])
+            session.current_level = data.get("current_level", 1)
+            session.current_lab = data.get("current_lab", 0)
+            return True
+        except (OSError, ValueError):
+            return False
+    return False
+
+def reset_progress():
+    session.xp = 0
+    session.achievements = []
+    session.current_level = 1
+    session.current_lab = 0
+    if os.path.exists(SAVE_FILE):
+        os.remove(SAVE_FILE)
+
+# ─── CHECKPOINT CACHE ──────────────────────────────────
+# Every checkpoint lives in one bare repo as refs/checkpoints/<name>/...,
+# so consecutive checkpoints share their objects instead of each carrying
+# a full copy. The branch that was checked out goes in <name>.head next to it.
+def checkpoint_head_file(name):
+    return os.path.join(CHECKPOINT_DIR, f"{name}.head")
+
+def checkpoint_base():
+    """The bare repo holding every checkpoint, created on first use."""
+    if not os.path.isdir(BASE_REPO):
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+        run_git("init", "--quiet", "--bare", BASE_REPO, cwd=CHECKPOINT_DIR)
+        # Sandboxes borrow its objects, so only prune_checkpoints may drop any.
+        run_git("config", "gc.auto", "0", cwd=BASE_REPO)
+    return BASE_REPO
+
+def drop_checkpoint(name):
+    ok, out = run_git("for-each-ref", "--format=delete %(refname)", f"refs/checkpoints/{name}/", cwd=BASE_REPO)
+    if ok and out:
+        run_git("update-ref", "--stdin", input=out + "\n", cwd=BASE_REPO)
+    if os.path.exists(checkpoint_head_file(name)):
+        os.remove(checkpoint_head_file(name))
+
+def save_checkpoint(name):
+    """Store the quest repo's branches and tags under `name` ("level-3" at the end of a level, "resume" mid-level)."""
+    if not is_git_repo():
+        return
+    base = checkpoint_base()
+    branch, head = read_head()
+    if not head:
+        # Nothing committed yet: a stale checkpoint must not be restored later.
+        drop_checkpoint(name)
+        return
+    ns = f"refs/checkpoints/{name}"
+    ok, out = run_git("push", "--quiet", "--force", "--prune", base,
+                      f"refs/heads/*:{ns}/heads/*", f"refs/tags/*:{ns}/tags/*")
+    if not ok:
+        drop_checkpoint(name)
+        return
+    with open(checkpoint_head_file(name), "w") as f:
+        f.write(branch or head)
+
+def fill_from_checkpoint(path, name, shared=False):
+    """Turn `path` into a repo holding checkpoint `name`'s branches and tags, same checkout.
+
+    With `shared`, objects are borrowed from the checkpoint repo through
+    alternates instead of copied. Returns True on success.
+    """
+    try:
+        with open(checkpoint_head_file(name), "r") as f:
+            head = f.read().strip()
+    except OSError:
+        return False
+    os.makedirs(path, exist_ok=True)
+    run_git("init", "--quiet", "--initial-branch=main", cwd=path)
+    if shared:
+        relax_fsync(path)
+        with open(os.path.join(path, ".git", "objects", "info", "alternates"), "w") as f:
+            f.write(os.path.join(os.path.abspath(BASE_REPO), "objects") + "\n")
+    ns = f"refs/checkpoints/{name}"
+    ok, out = run_git("fetch", "--quiet", "--update-head-ok", BASE_REPO,
+                      f"{ns}/heads/*:refs/heads/*", f"{ns}/tags/*:refs/tags/*", cwd=path)
+    if not ok:
+        return False
+    run_git("checkout", "--quiet", "--force", head, cwd=path)
+    os.utime(checkpoint_head_file(name))
+    return True
+
+def restore_checkpoint(name):
+    """Rebuild the quest dir from checkpoint `name`. The copy is self-contained. Returns True on success."""
+    return fill_from_checkpoint(session.quest_dir, name)
+
+def prune_checkpoints():
+    """Drop least recently used checkpoints until the store fits CHECKPOINT_CACHE_MB."""
+    if sandboxes:
+        return  # they borrow objects from the store
+    ok, out = run_git("count-objects", "-v", cwd=BASE_REPO)
+    sizes = dict(line.split(": ") for line in out.split("\n") if ": " in line) if ok else {}
+    total_kb = int(sizes.get("size", 0)) + int(sizes.get("size-pack", 0))
+    if total_kb <= CHECKPOINT_CACHE_MB * 1024:
+        return
+    names = [name[:-len(".head")] for name in os.listdir(CHECKPOINT_DIR) if name.endswith(".head")]
+    names.sort(key=lambda name: os.path.getmtime(checkpoint_head_file(name)))
+    for name in names[:max(1, len(names) // 2)]:
+        drop_checkpoint(name)
+    run_git("gc", "--quiet", "--prune=now", cwd=BASE_REPO, timeout=120)
+
+# ─── QUEST STORAGE ─────────────────────────────────────
+# Quest repos live in the current directory, or with --ram in a RAM-backed
+# one, so a slow or networked home directory only sees the final export.
+# Repos the game throws away get a config that skips fsync.
+quest_root = None       # directory holding the quest repos; None means the current one
+SCRATCH_CONFIG = "[core]\n\tfsync = none\n"
+
+def quest_path(name):
+    return os.path.join(quest_root or os.getcwd(), name)
+
+def ram_dir():
+    """A per-user, per-save directory on /dev/shm, or in the temp dir where there's no /dev/shm."""
+    import zlib, getpass, tempfile
+    base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else tempfile.gettempdir()
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):     # no login name or passwd entry, as in some containers
+        user = str(os.getuid()) if hasattr(os, "getuid") else str(os.getpid())
+    path = os.path.join(base, f"git-quest-{user}-{zlib.crc32(DATA_DIR.encode()):08x}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def import_quest_repo():
+    """Start a --ram session from ./git-quest, the copy the last session left on disk."""
+    src, dest = os.path.join(os.getcwd(), "git-quest"), quest_path("git-quest")
+    shutil.rmtree(dest, ignore_errors=True)
+    if os.path.isdir(src):
+        shutil.copytree(src, dest, symlinks=True)
+
+def export_quest_repo():
+    """Copy the quest repo out of RAM to ./git-quest, replacing what's there, and free the RAM."""
+    src, dest = quest_path("git-quest"), os.path.join(os.getcwd(), "git-quest")
+    if os.path.isdir(src):
+        shutil.rmtree(dest, ignore_errors=True)
+        shutil.copytree(src, dest, symlinks=True)
+        print(f"\n  {C.GREEN}💾 Exported your quest repo from RAM to {dest}{C.RESET}")
+        sys.stdout.flush()
+    shutil.rmtree(quest_root, ignore_errors=True)
+
+def relax_fsync(path):
+    """Give the throwaway repo at `path` the no-fsync scratch config."""
+    with open(os.path.join(path, ".git", "config"), "a") as f:
+        f.write(SCRATCH_CONFIG)
+
+# ─── LAB SANDBOXES ─────────────────────────────────────
+sandboxes = []      # open sandbox paths
+
+def open_sandbox(name, checkpoint):
+    """A throwaway quest repo git-quest-<name>, started from `checkpoint` if it exists.
+
+    It borrows the checkpoint store's objects instead of copying them, so
+    opening one is a few refs and a checkout, and closing it deletes only
+    those. Returns the path.
+    """
+    path = quest_path(f"git-quest-{name}")
+    close_sandbox(path)
+    sandboxes.append(path)
+    if not fill_from_checkpoint(path, checkpoint, shared=True):
+        os.makedirs(path, exist_ok=True)
+        run_git("init", "--quiet", "--initial-branch=main", cwd=path)
+        relax_fsync(path)
+    return path
+
+def close_sandbox(path):
+    shutil.rmtree(path, ignore_errors=True)
+    if path in sandboxes:
+        sandboxes.remove(path)
+
+# ─── MENU SYSTEM ───────────────────────────────────────
+def show_progress_screen():
+    clear()
+    banner("YOUR PROGRESS")
+    total_xp = 3800
+    pct = int((session.xp / total_xp) * 100) if total_xp > 0 else 0
+    bar_len = 30
+    filled = int(bar_len * pct / 100)
+    bar = f"{C.GREEN}{'█' * filled}{C.DIM}{'░' * (bar_len - filled)}{C.RESET}"
+
+    print(f"\n  {C.BOLD}XP: {C.GOLD}{session.xp} / {total_xp}{C.RESET}  [{bar}] {pct}%")
+    print(f"  {C.BOLD}Level: {C.CYAN}{session.current_level} / 8{C.RESET}")
+    print(f"  {C.BOLD}Achievements: {C.MAGENTA}{len(session.achievements)} / 12{C.RESET}\n")
+
+    if session.achievements:
+        for a in session.achievements:
+            print(f"    {C.MAGENTA}🏅 {a}{C.RESET}")
+    else:
+        print(f"    {C.DIM}No achievements yet. Start playing!{C.RESET}")
+    pause("\n  Press ENTER to go back...")
+
+def level_select_menu():
+    levels = [
+        ("The Awakening", "Git basics — init, add, commit"),
+        ("First Blood", "Undo spells — restore, reset, amend"),
+        ("The Multiverse", "Branches, merging, conflict boss"),
+        ("The Cloud Kingdom", "GitHub, push, pull, clone"),
+        ("The Final Boss", "Stash, recovery, reflog, aliases"),
+        ("The Guild", "Team workflow, blame, cherry-pick"),
+        ("The War Room", "Code review, squash, bisect"),
+        ("The Throne Room", "Tags, hotfix, release management"),
+    ]
+
+    while True:
+        clear()
+        banner("LEVEL SELECT")
+        for i, (name, desc) in enumerate(levels, 1):
+            if i < session.current_level:
+                status = f"{C.GREEN}✅"
+            elif i == session.current_level:
+                status = f"{C.CYAN}▶️ "
+            else:
+                status = f"{C.DIM}🔒"
+            lock = "" if i <= session.current_level else f" {C.DIM}(locked){C.RESET}"
+            print(f"  {status}  {i}. Level {i}: {name}{C.RESET}{lock}")
+            print(f"       {C.DIM}{desc}{C.RESET}")
+
+        print(f"\n  {C.DIM}You can play any unlocked level (1-{session.current_level}).{C.RESET}")
+        choice = read_input(f"\n  {C.CYAN}Choose level (1-8) or 'back': {C.RESET}").strip().lower()
+
+        if choice == "back" or choice == "b":
+            return None
+
+        try:
+            level = int(choice)
+            if 1 <= level <= session.current_level:
+                return level
+            elif 1 <= level <= 8:
+                print(f"\n  {C.RED}Level {level} is locked! Complete Level {session.current_level} first.{C.RESET}")
+                pause()
+            else:
+                print(f"\n  {C.RED}Invalid choice.{C.RESET}")
+                pause()
+        except ValueError:
+            pass
+
+def draw_main_menu():
+    clear()
+    lvl_text = f"Level {session.current_level}" if session.current_level <= 8 else "All Complete!"
+    print(f"""
+{C.GOLD}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║       ⚔️   T H E   G I T   Q U E S T   ⚔️        ║
+    ║                                                  ║
+    ╠══════════════════════════════════════════════════╣
+    ║                                                  ║
+    ║    1.  🆕  New Game                               ║
+    ║    2.  ▶️   Continue ({lvl_text:15s})         ║
+    ║    3.  🗺️   Level Select                          ║
+    ║    4.  📊  Progress                               ║
+    ║    5.  ❌  Quit                                   ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+
+def main_menu():
+    load_progress()
+
+    while True:
+        draw_main_menu()
+        choice = read_input(f"  {C.CYAN}Choose (1-5): {C.RESET}").strip()
+
+        if choice == "1":
+            reset_progress()
+            return ("new", 1)
+        elif choice == "2":
+            if session.current_level > 8:
+                print(f"\n  {C.GREEN}You've completed all levels! Start a new game or select a level.{C.RESET}")
+                pause()
+            else:
+                return ("continue", session.current_level)
+        elif choice == "3":
+            level = level_select_menu()
+            if level is not None:
+                return ("select", level)
+        elif choice == "4":
+            show_progress_screen()
+        elif choice == "5":
+            leave_alt_screen()
+            print(f"\n  {C.GOLD}Until next time, adventurer! ⚔️{C.RESET}\n")
+            sys.exit(0)
+
+# ─── TITLE SCREEN ───────────────────────────────────────
+def title_screen():
+    clear()
+    print(f"""
+{C.GOLD}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║     ⚔️   T H E   G I T   Q U E S T   ⚔️          ║
+    ║                                                  ║
+    ║     An Interactive Game to Learn Git              ║
+    ║                                                  ║
+    ║     • 8 Levels  (3 NEW team workflow labs!)       ║
+    ║     • Hands-on Labs                              ║
+    ║     • 3800 XP to earn                            ║
+    ║     • 12 Achievements to unlock                  ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}
+{C.DIM}    You will learn Git by DOING, not reading.
+    The game will guide you through every step.
+    Type commands when asked. The game checks your work.{C.RESET}
+""")
+    pause("Press ENTER to begin your quest...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 1: THE AWAKENING
+# ═══════════════════════════════════════════════════════
+def level_1_intro():
+    clear()
+    banner("LEVEL 1: THE AWAKENING  ⭐ 100 XP")
+
+    story("You wake up in a world where code disappears,")
+    story("files get lost, and nobody knows who changed what.")
+    story("You discover an ancient tool called 'Git'...")
+    pause()
+
+# ─── LAB 1: Identity ───
+def level_1_lab_1():
+    clear()
+    banner("LEVEL 1 — LAB 1: YOUR IDENTITY")
+    mission("Tell Git who you are.")
+    story("Before wielding Git, you must register your identity.")
+
+    print(f"\n{C.BOLD}  Git needs two things: your name and your email.{C.RESET}")
+    print(f"  These appear on every commit you make.\n")
+
+    instruction("Type this command (use YOUR real name):")
+    show_command('git config --global user.name "Your Name"')
+
+    cmd = expect(lambda cmd: cmd.startswith("git config") and "user.name" in cmd, 'Type: git config --global user.name "Your Name"')
+    while not run_typed_command(cmd):
+        cmd = expect(*last_expect)
+    success("Identity name set!")
+    award_xp(10, "Name configured")
+
+    instruction("Now set your email:")
+    show_command('git config --global user.email "you@example.com"')
+
+    cmd = expect(lambda cmd: cmd.startswith("git config") and "user.email" in cmd, 'Type: git config --global user.email "you@example.com"')
+    while not run_typed_command(cmd):
+        cmd = expect(*last_expect)
+    success("Identity email set!")
+    award_xp(10, "Email configured")
+
+    # Verify
+    print(f"\n{C.BOLD}  Let's verify it worked.{C.RESET}")
+    instruction("Type:")
+    show_command("git config user.name")
+
+    cmd = expect(lambda cmd: "config" in cmd and "user.name" in cmd, "Type: git config user.name")
+    while not run_typed_command(cmd):
+        cmd = expect(*last_expect)
+    success("Your name appeared above! Identity confirmed.")
+
+    pause()
+
+# ─── LAB 2: First Repo ───
+def level_1_lab_2():
+    clear()
+    banner("LEVEL 1 — LAB 2: CREATE YOUR FIRST REPO")
+    mission("Create a Git repository from scratch.")
+
+    story("A 'repo' is just a folder that Git watches over.")
+    story("Let's create one called 'git-quest'.\n")
+
+    # Determine quest directory location (a replay sandbox keeps its own)
+    if session.quest_dir not in sandboxes:
+        session.quest_dir = quest_path("git-quest")
+
+    if os.path.exists(session.quest_dir):
+        print(f"{C.DIM}  (Found existing git-quest folder, cleaning up...){C.RESET}")
+        shutil.rmtree(session.quest_dir)
+
+    instruction("Type this to create a new folder:")
+    show_command("mkdir git-quest")
+
+    expect(lambda cmd: "mkdir" in cmd and "git-quest" in cmd, "Type: mkdir git-quest")
+    os.makedirs(session.quest_dir, exist_ok=True)
+    success("Folder created!")
+
+    instruction("Now enter the folder:")
+    show_command("cd git-quest")
+
+    expect(lambda cmd: "cd" in cmd and "git-quest" in cmd, "Type: cd git-quest")
+    if os.path.isdir(session.quest_dir):
+        success("You're inside git-quest!")
+
+    instruction("Now cast the init spell:")
+    show_command("git init")
+
+    cmd = expect("git init", "Type exactly: git init")
+    ok, out = play(cmd, "init", "--initial-branch=main", check=is_git_repo)
+    if ok:
+        print(f"\n  {C.DIM}{out}{C.RESET}")
+        success("Repository created! Git is now watching this folder.")
+        award_xp(20, "First repository!")
+    else:
+        fail(f"Something went wrong: {out}")
+
+    pause()
+
+# ─── LAB 3: The Three Zones ───
+def level_1_lab_3():
+    clear()
+    banner("LEVEL 1 — LAB 3: THE THREE ZONES")
+    mission("Understand how Git saves your work.")
+
+    print(f"""
+{C.BOLD}  Git has 3 zones. This is THE key concept:{C.RESET}
+
+  {C.CYAN}📂 WORKING DIR{C.RESET}    →    {C.GOLD}📋 STAGING{C.RESET}    →    {C.GREEN}📦 SAVED{C.RESET}
+     (your files)        (ready to save)      (committed!)
+                    {C.CYAN}git add{C.RESET}          {C.GOLD}git commit{C.RESET}
+
+  Think of mailing a package:
+  1. 📂 Pick items from your room      (edit files)
+  2. 📋 Put them in the box             (git add)
+  3. 📦 Seal and label the box          (git commit)
+""")
+    pause("Got it? Press ENTER to try it...")
+
+    instruction("Create your first file — type:")
+    show_command('echo "Hello, I am learning Git!" > hero.txt')
+
+    expect(lambda cmd: "hero.txt" in cmd, 'Type: echo "Hello, I am learning Git!" > hero.txt')
+    write_file("hero.txt", "Hello, I am learning Git!\n")
+    success("File created!")
+
+    instruction("Now check what Git sees:")
+    show_command("git status")
+
+    cmd = expect("git status", "Type: git status")
+    ok, out = play(cmd, "status")
+    print(f"\n{C.RED}  {out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}See hero.txt in RED? That means it's in your")
+    print(f"  working directory but NOT staged yet.{C.RESET}")
+
+    instruction("Stage it (put it in the box):")
+    show_command("git add hero.txt")
+
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hero.txt")
+    play(cmd, "add", "hero.txt", check=staged("hero.txt"))
+    success("File staged!")
+
+    instruction("Check status again — notice the color change:")
+    show_command("git status")
+
+    cmd = expect(lambda cmd: "status" in cmd, "Type: git status")
+    ok, out = play(cmd, "status")
+    print(f"\n{C.GREEN}  {out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}Now it's GREEN! That means it's staged and")
+    print(f"  ready to be committed (sealed in the box).{C.RESET}")
+
+    instruction("Commit it (seal the box with a label):")
+    show_command('git commit -m "Begin my quest: create hero file"')
+
+    cmd = expect(lambda cmd: "git commit" in cmd and "-m" in cmd, 'Type: git commit -m "Begin my quest: create hero file"')
+    msg = cmd.split("-m")[-1].strip().strip('"').strip("'")
+    if not msg:
+        msg = "Begin my quest: create hero file"
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("COMMITTED! Your first save point!")
+    award_xp(30, "First commit!")
+    achievement("First Commit")
+
+    pause()
+
+# ─── LAB 4: More History ───
+def level_1_lab_4():
+    clear()
+    banner("LEVEL 1 — LAB 4: BUILD YOUR HISTORY")
+    mission("Make another commit and explore your timeline.")
+
+    instruction("Add a second line to hero.txt:")
+    show_command('echo "I completed Level 1!" >> hero.txt')
+
+    expect(lambda cmd: "hero.txt" in cmd, 'Type: echo "I completed Level 1!" >> hero.txt')
+    append_file("hero.txt", "I completed Level 1!\n")
+    success("File updated!")
+
+    instruction("See what changed:")
+    show_command("git diff")
+
+    cmd = expect(lambda cmd: "diff" in cmd, "Type: git diff")
+    ok, out = play(cmd, "diff")
+    if out:
+        for line in out.split("\n"):
+            if line.startswith("+") and not line.startswith("+++"):
+                print(f"  {C.GREEN}{line}{C.RESET}")
+            elif line.startswith("-") and not line.startswith("---"):
+                print(f"  {C.RED}{line}{C.RESET}")
+            else:
+                print(f"  {C.DIM}{line}{C.RESET}")
+        print(f"\n  {C.BOLD}The + line is what you ADDED. Git tracks every change!{C.RESET}")
+
+    instruction("Stage and commit:")
+    show_command("git add hero.txt")
+
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hero.txt")
+    play(cmd, "add", "hero.txt", check=staged("hero.txt"))
+    success("Staged!")
+
+    show_command('git commit -m "Update hero: completed Level 1"')
+
+    cmd = expect(lambda cmd: "git commit" in cmd, 'Type: git commit -m "Update hero: completed Level 1"')
+    msg = "Update hero: completed Level 1"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("Second commit saved!")
+    award_xp(20, "Building history")
+
+    instruction("View your timeline:")
+    show_command("git log --oneline")
+
+    cmd = expect(lambda cmd: "log" in cmd, "Type: git log --oneline")
+    ok, out = play(cmd, "log", "--oneline")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}Two commits! You can see your entire journey!{C.RESET}")
+    achievement("Time Traveler")
+    award_xp(10, "Explored history")
+
+# ─── Level Complete ───
+def level_1_complete():
+    clear()
+    banner("LEVEL 1 COMPLETE!")
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  You learned:                                    ║
+    ║                                                  ║
+    ║  • git init         → Create a repo              ║
+    ║  • git add          → Stage files                ║
+    ║  • git commit -m    → Save a snapshot            ║
+    ║  • git status       → See what's going on        ║
+    ║  • git diff         → See what changed           ║
+    ║  • git log          → View your history          ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+    show_xp()
+    pause("Press ENTER to continue to Level 2...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 2: FIRST BLOOD
+# ═══════════════════════════════════════════════════════
+def level_2_intro():
+    clear()
+    banner("LEVEL 2: FIRST BLOOD  ⭐ 200 XP")
+
+    story("You can save your progress. But what happens when")
+    story("you make a mistake? Time to learn the UNDO spells.")
+    pause()
+
+# ─── LAB 1: Multiple Files ───
+def level_2_lab_1():
+    clear()
+    banner("LEVEL 2 — LAB 1: BUILD YOUR PARTY")
+    mission("Create multiple files and stage them all at once.")
+
+    instruction("Create three party members:")
+    show_command('echo "Warrior - High strength" > warrior.txt')
+
+    expect(lambda cmd: "warrior" in cmd.lower(), 'Type: echo "Warrior - High strength" > warrior.txt')
+    write_file("warrior.txt", "Warrior - High strength\n")
+    success("Warrior created!")
+
+    show_command('echo "Mage - High intelligence" > mage.txt')
+    expect(lambda cmd: "mage" in cmd.lower(), 'Type: echo "Mage - High intelligence" > mage.txt')
+    write_file("mage.txt", "Mage - High intelligence\n")
+    success("Mage created!")
+
+    show_command('echo "Healer - High wisdom" > healer.txt')
+    expect(lambda cmd: "healer" in cmd.lower(), 'Type: echo "Healer - High wisdom" > healer.txt')
+    write_file("healer.txt", "Healer - High wisdom\n")
+    success("Healer created!")
+
+    instruction("Now stage ALL files at once with the dot shortcut:")
+    show_command("git add .")
+
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add .")
+    play(cmd, "add", ".", check=staged("warrior.txt", "mage.txt", "healer.txt"))
+    success("All three files staged at once!")
+    print(f"  {C.DIM}The '.' means 'everything that changed'{C.RESET}")
+
+    instruction("Commit your party:")
+    show_command('git commit -m "Recruit party: warrior, mage, healer"')
+
+    cmd = expect(lambda cmd: "git commit" in cmd, 'Type: git commit -m "Recruit party: warrior, mage, healer"')
+    msg = "Recruit party: warrior, mage, healer"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("Party recruited!")
+    award_xp(30, "Multi-file commit")
+
+    pause()
+
+# ─── LAB 2: Undo — Restore ───
+def level_2_lab_2():
+    clear()
+    banner("LEVEL 2 — LAB 2: UNDO SPELL — RESTORE")
+    mission("Undo changes you haven't staged yet.")
+
+    story("Oh no! Someone corrupted your warrior's file!")
+
+    instruction("Break the warrior file on purpose:")
+    show_command('echo "CORRUPTED DATA" > warrior.txt')
+
+    expect(lambda cmd: "warrior" in cmd.lower(), 'Type: echo "CORRUPTED DATA" > warrior.txt')
+    write_file("warrior.txt", "CORRUPTED DATA\n")
+    success("File corrupted! 😈")
+
+    instruction("Check the damage:")
+    show_command("git diff warrior.txt")
+
+    cmd = expect(lambda cmd: "diff" in cmd, "Type: git diff warrior.txt")
+    ok, out = play(cmd, "diff", "warrior.txt")
+    for line in out.split("\n"):
+        if line.startswith("+") and not line.startswith("+++"):
+            print(f"  {C.RED}{line}{C.RESET}")
+        elif line.startswith("-") and not line.startswith("---"):
+            print(f"  {C.GREEN}{line}{C.RESET}")
+    print(f"\n  {C.BOLD}See? Git shows the corruption!{C.RESET}")
+
+    instruction("Cast the RESTORE spell to undo:")
+    show_command("git restore warrior.txt")
+
+    cmd = expect(lambda cmd: "restore" in cmd and "warrior" in cmd, "Type: git restore warrior.txt")
+    play(cmd, "restore", "warrior.txt", check=lambda: "warrior.txt" not in repo_snapshot().modified)
+    content = read_file("warrior.txt")
+    success(f"RESTORED! File says: '{content}'")
+    print(f"  {C.BOLD}The corruption is gone! Git had a backup.{C.RESET}")
+    award_xp(30, "Restore spell mastered")
+
+    pause()
+
+# ─── LAB 3: Unstage ───
+def level_2_lab_3():
+    clear()
+    banner("LEVEL 2 — LAB 3: UNDO SPELL — UNSTAGE")
+    mission("Remove a file from staging without losing changes.")
+
+    instruction("Create and stage a thief:")
+    show_command('echo "Thief - High agility" > thief.txt')
+
+    expect(lambda cmd: "thief" in cmd.lower(), 'Type: echo "Thief - High agility" > thief.txt')
+    write_file("thief.txt", "Thief - High agility\n")
+    success("Thief created!")
+
+    show_command("git add thief.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add thief.txt")
+    play(cmd, "add", "thief.txt", check=staged("thief.txt"))
+    success("Thief staged!")
+
+    print(f"\n  {C.BOLD}Wait... we don't want the thief yet. UNSTAGE it:{C.RESET}")
+    show_command("git restore --staged thief.txt")
+
+    cmd = expect(lambda cmd: "restore" in cmd and "staged" in cmd, "Type: git restore --staged thief.txt")
+    play(cmd, "restore", "--staged", "thief.txt", check=lambda: "thief.txt" not in repo_snapshot().staged)
+    success("Unstaged! The file still exists but won't be committed.")
+    award_xp(20, "Unstage spell mastered")
+
+    # Clean up thief
+    delete_file("thief.txt")
+
+    pause()
+
+# ─── LAB 4: Amend ───
+def level_2_lab_4():
+    clear()
+    banner("LEVEL 2 — LAB 4: UNDO SPELL — AMEND")
+    mission("Fix a bad commit message.")
+
+    instruction("Make a commit with a typo:")
+    write_file("potion.txt", "Health Potion - Restore 50 HP\n")
+    run_git("add", "potion.txt")
+    show_command('git commit -m "Add heath poton"')
+
+    cmd = expect(lambda cmd: "git commit" in cmd, 'Type: git commit -m "Add heath poton"')
+    play(cmd, "commit", "-m", "Add heath poton", check=head_moved())
+    success("Committed... but 'heath poton'? That's a typo! 😅")
+
+    instruction("Fix it with amend:")
+    show_command('git commit --amend -m "Add health potion"')
+
+    cmd = expect(lambda cmd: "amend" in cmd, 'Type: git commit --amend -m "Add health potion"')
+    msg = "Add health potion"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "--amend", "-m", msg, check=head_moved())
+    success("Fixed! Check your log — the typo is gone:")
+    ok, out = run_git("log", "--oneline", "-1")
+    print(f"  {C.GREEN}  {out}{C.RESET}")
+    award_xp(20, "Amend spell mastered")
+
+    pause()
+
+# ─── LAB 5: Soft Reset ───
+def level_2_lab_5():
+    clear()
+    banner("LEVEL 2 — LAB 5: UNDO SPELL — RESET")
+    mission("Undo your last commit entirely (but keep the files).")
+
+    print(f"""
+  {C.BOLD}git reset --soft HEAD~1{C.RESET}
+
+  This means:
+  • {C.CYAN}reset{C.RESET}     = go back
+  • {C.CYAN}--soft{C.RESET}    = keep the files (just undo the commit)
+  • {C.CYAN}HEAD~1{C.RESET}    = go back 1 commit
+""")
+
+    instruction("Undo the health potion commit:")
+    show_command("git reset --soft HEAD~1")
+
+    cmd = expect(lambda cmd: "reset" in cmd and "soft" in cmd, "Type: git reset --soft HEAD~1")
+    play(cmd, "reset", "--soft", "HEAD~1", check=head_moved())
+    success("Last commit UNDONE! But potion.txt is still here, just staged.")
+    ok, out = run_git("status")
+    for line in out.split("\n"):
+        if "potion" in line:
+            print(f"  {C.GREEN}  {line.strip()}{C.RESET}")
+    award_xp(30, "Reset spell mastered")
+
+    # Re-commit so state is clean
+    run_git("commit", "-m", "Add health potion")
+
+    pause()
+
+# ─── LAB 6: .gitignore ───
+def level_2_lab_6():
+    clear()
+    banner("LEVEL 2 — LAB 6: THE IGNORE SHIELD")
+    mission("Tell Git to ignore files you don't want tracked.")
+
+    story("Some files should NEVER be tracked — passwords, logs, temp files.")
+
+    instruction("Create a secret file:")
+    show_command('echo "SECRET_KEY=abc123" > secrets.txt')
+
+    expect(lambda cmd: "secret" in cmd.lower(), 'Type: echo "SECRET_KEY=abc123" > secrets.txt')
+    write_file("secrets.txt", "SECRET_KEY=abc123\n")
+    success("Secret file created!")
+
+    instruction("Create the ignore shield:")
+    show_command('echo "secrets.txt" > .gitignore')
+
+    expect(lambda cmd: "gitignore" in cmd.lower() or "ignore" in cmd.lower(), 'Type: echo "secrets.txt" > .gitignore')
+    write_file(".gitignore", "secrets.txt\n*.log\n")
+    success("Ignore shield created!")
+
+    instruction("Check status — secrets.txt should be GONE:")
+    show_command("git status")
+
+    expect(lambda cmd: "status" in cmd, "Type: git status")
+    if "secrets.txt" not in repo_snapshot().untracked:
+        success("secrets.txt is INVISIBLE to Git! Shield working! 🛡️")
+    print(f"  {C.DIM}Only .gitignore shows up — commit it:{C.RESET}")
+
+    run_git("add", ".gitignore")
+    run_git("commit", "-m", "Add ignore shield")
+    award_xp(20, "Ignore shield activated")
+
+# ─── Level Complete ───
+def level_2_complete():
+    clear()
+    banner("LEVEL 2 COMPLETE!")
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  UNDO SPELLS MASTERED:                           ║
+    ║                                                  ║
+    ║  • git restore <file>          Undo changes      ║
+    ║  • git restore --staged <file> Unstage            ║
+    ║  • git commit --amend          Fix last commit   ║
+    ║  • git reset --soft HEAD~1     Undo commit        ║
+    ║  • .gitignore                  Hide files        ║
+    ║  • git add .                   Stage everything  ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+    show_xp()
+    pause("Press ENTER to continue to Level 3: THE MULTIVERSE (Branches!)...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 3: THE MULTIVERSE (Branching & Merging)
+# ═══════════════════════════════════════════════════════
+def level_3_intro():
+    clear()
+    banner("LEVEL 3: THE MULTIVERSE  ⭐ 400 XP")
+
+    print(f"""
+  {C.BOLD}This is the level that confuses most people.{C.RESET}
+  {C.BOLD}But NOT you — because you're going to DO it.{C.RESET}
+
+  {C.CYAN}A BRANCH is a parallel universe for your code.{C.RESET}
+
+  Imagine you're building a game. It works fine.
+  You want to add a new feature — but what if it
+  breaks everything?
+
+  {C.GREEN}WITH branches:{C.RESET}
+
+    main (working game) ──────────── still works! ✅
+         \\
+          feature (experiment) ──── try stuff here 🧪
+
+  If the experiment works → merge it back.
+  If it fails → delete it. Main is NEVER broken.
+""")
+    pause("Ready to create parallel universes? Press ENTER...")
+
+# ─── LAB 1: Create a Branch ───
+def level_3_lab_1():
+    clear()
+    banner("LEVEL 3 — LAB 1: YOUR FIRST BRANCH")
+    mission("Create a new branch and switch to it.")
+
+    instruction("First, see what branch you're on:")
+    show_command("git branch")
+
+    cmd = expect(lambda cmd: "branch" in cmd and "checkout" not in cmd and "-b" not in cmd, "Type: git branch")
+    ok, out = play(cmd, "branch")
+    print(f"\n  {C.GREEN}{out}{C.RESET}")
+    print(f"\n  {C.BOLD}The * means 'you are here'. You're on main.{C.RESET}")
+
+    instruction("Create AND switch to a new branch:")
+    show_command("git checkout -b add-weapons")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd, "Type: git checkout -b add-weapons")
+    branch_name = cmd.split()[-1] if len(cmd.split()) > 3 else "add-weapons"
+    play(cmd, "checkout", "-b", branch_name, check=on_branch(branch_name))
+    cur = get_current_branch()
+    success(f"You're now on branch '{cur}'!")
+    print(f"\n  {C.BOLD}You just entered a parallel universe! 🌌{C.RESET}")
+    award_xp(20, "First branch created")
+
+    pause()
+
+# ─── LAB 2: Work in a Branch ───
+def level_3_lab_2():
+    clear()
+    banner("LEVEL 3 — LAB 2: PROOF THAT BRANCHES ARE SEPARATE")
+    mission("Add a file on this branch, then watch it DISAPPEAR on main.")
+
+    cur = get_current_branch()
+    print(f"\n  {C.BOLD}You're on: {C.CYAN}{cur}{C.RESET}")
+
+    instruction("Create a weapons file:")
+    show_command('echo "Sword of Truth - 50 damage" > weapons.txt')
+
+    expect(lambda cmd: "weapon" in cmd.lower(), 'Type: echo "Sword of Truth - 50 damage" > weapons.txt')
+    write_file("weapons.txt", "Sword of Truth - 50 damage\n")
+    success("weapons.txt created!")
+
+    instruction("Stage and commit:")
+    show_command("git add weapons.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add weapons.txt")
+    play(cmd, "add", "weapons.txt", check=staged("weapons.txt"))
+
+    show_command('git commit -m "Add Sword of Truth"')
+    cmd = expect(lambda cmd: "git commit" in cmd, 'Type: git commit -m "Add Sword of Truth"')
+    play(cmd, "commit", "-m", "Add Sword of Truth", check=head_moved())
+    success("Committed on add-weapons branch!")
+
+    print(f"\n  {C.BOLD}Now watch this magic...{C.RESET}")
+    pause()
+
+    instruction("Switch back to main:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+    success("Switched to main!")
+
+    print(f"\n  {C.BOLD}Now check if weapons.txt exists:{C.RESET}")
+
+    if check_file_exists("weapons.txt"):
+        print(f"  {C.DIM}weapons.txt is here (fast-forward){C.RESET}")
+    else:
+        print(f"\n  {C.RED}  ⚡ weapons.txt is GONE!{C.RESET}")
+        print(f"  {C.BOLD}  It only exists on add-weapons branch!{C.RESET}")
+
+    instruction("Switch back to confirm it's there:")
+    show_command("git checkout add-weapons")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "add-weapons" in cmd, "Type: git checkout add-weapons")
+    play(cmd, "checkout", "add-weapons", check=on_branch("add-weapons"))
+    if check_file_exists("weapons.txt"):
+        print(f"\n  {C.GREEN}  ⚡ weapons.txt is BACK!{C.RESET}")
+    success("Each branch is its own world! Files appear/disappear!")
+    award_xp(40, "Branch isolation proven")
+
+    pause()
+
+# ─── LAB 3: First Merge ───
+def level_3_lab_3():
+    clear()
+    banner("LEVEL 3 — LAB 3: YOUR FIRST MERGE")
+    mission("Bring weapons into main.")
+
+    print(f"""
+{C.GOLD}  ┌──────────────────────────────────────────┐
+  │  THE GOLDEN RULE OF MERGING:             │
+  │                                          │
+  │  1. Go to the DESTINATION branch first   │
+  │  2. Then merge the SOURCE into it        │
+  │                                          │
+  │  Want weapons in main?                   │
+  │  → Go to main  →  merge add-weapons     │
+  └──────────────────────────────────────────┘{C.RESET}
+""")
+
+    instruction("Step 1 — Go to the destination (main):")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+    success("On main — ready to receive!")
+
+    instruction("Step 2 — Merge weapons into main:")
+    show_command("git merge add-weapons")
+
+    cmd = expect(lambda cmd: "merge" in cmd, "Type: git merge add-weapons")
+    ok, out = play(cmd, "merge", "add-weapons", check=merged("add-weapons"))
+    print(f"\n  {C.DIM}{out}{C.RESET}")
+    if ok:
+        success("MERGED! weapons.txt is now on main! 🎉")
+    award_xp(40, "First merge!")
+
+    instruction("Clean up — delete the branch:")
+    show_command("git branch -d add-weapons")
+
+    cmd = expect(lambda cmd: "branch" in cmd and "-d" in cmd, "Type: git branch -d add-weapons")
+    play(cmd, "branch", "-d", "add-weapons", check=lacks_ref("refs/heads/add-weapons"))
+    success("Branch deleted! Clean and tidy.")
+
+    instruction("See your history with branches:")
+    show_command("git log --oneline --graph --all")
+
+    cmd = expect(lambda cmd: "log" in cmd, "Type: git log --oneline --graph --all")
+    ok, out = play(cmd, "log", "--oneline", "--graph", "--all")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+
+    pause()
+
+# ─── LAB 4: MERGE CONFLICT BOSS FIGHT ───
+def level_3_lab_4():
+    clear()
+    banner("☠️  BOSS FIGHT: THE MERGE CONFLICT")
+
+    print(f"""
+{C.RED}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  A MERGE CONFLICT happens when two branches      ║
+    ║  change THE SAME LINE in the same file.          ║
+    ║                                                  ║
+    ║  Git doesn't know which to keep.                 ║
+    ║  So it asks YOU to decide.                       ║
+    ║                                                  ║
+    ║  We're going to CREATE one on purpose            ║
+    ║  so you'll never be scared of them again.        ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+    pause("Ready for the boss fight? Press ENTER...")
+
+    clear()
+    banner("BOSS FIGHT — STEP 1: SET THE TRAP")
+    mission("Create conflicting changes on two branches.")
+
+    instruction("Create a branch and change hero.txt:")
+    show_command("git checkout -b fire-upgrade")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd, "Type: git checkout -b fire-upgrade")
+    play(cmd, "checkout", "-b", "fire-upgrade", check=on_branch("fire-upgrade"))
+    success("On fire-upgrade branch!")
+
+    show_command('echo "Hero Class: Fire Knight" > hero.txt')
+    expect(lambda cmd: "hero" in cmd.lower(), 'Type: echo "Hero Class: Fire Knight" > hero.txt')
+    write_file("hero.txt", "Hero Class: Fire Knight\n")
+
+    instruction("Stage and commit:")
+    show_command("git add hero.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hero.txt")
+    play(cmd, "add", "hero.txt", check=staged("hero.txt"))
+
+    show_command('git commit -m "Upgrade hero to Fire Knight"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "Upgrade hero to Fire Knight"')
+    play(cmd, "commit", "-m", "Upgrade hero to Fire Knight", check=head_moved())
+    success("Fire Knight committed!")
+
+    pause()
+
+    instruction("Now go to main and make a DIFFERENT change:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+    success("Back on main!")
+
+    show_command('echo "Hero Class: Ice Wizard" > hero.txt')
+    expect(lambda cmd: "hero" in cmd.lower(), 'Type: echo "Hero Class: Ice Wizard" > hero.txt')
+    write_file("hero.txt", "Hero Class: Ice Wizard\n")
+
+    show_command("git add hero.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hero.txt")
+    play(cmd, "add", "hero.txt", check=staged("hero.txt"))
+
+    show_command('git commit -m "Upgrade hero to Ice Wizard"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "Upgrade hero to Ice Wizard"')
+    play(cmd, "commit", "-m", "Upgrade hero to Ice Wizard", check=head_moved())
+    success("Ice Wizard committed on main!")
+
+    print(f"""
+  {C.RED}
+  NOW WE HAVE A CONFLICT:
+
+    main:          hero.txt = "Hero Class: Ice Wizard"
+    fire-upgrade:  hero.txt = "Hero Class: Fire Knight"
+
+  Git can't pick for you!{C.RESET}
+""")
+    pause()
+
+    # ─── Trigger the conflict ───
+    clear()
+    banner("BOSS FIGHT — STEP 2: TRIGGER THE CONFLICT")
+
+    instruction("Try to merge:")
+    show_command("git merge fire-upgrade")
+
+    cmd = expect(lambda cmd: "merge" in cmd, "Type: git merge fire-upgrade")
+    ok, out = play(cmd, "merge", "fire-upgrade", check=has_conflict, may_fail=True)
+    print(f"\n  {C.RED}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    if not ok or has_conflict():
+        print(f"\n  {C.RED}  ⚡ CONFLICT DETECTED! Don't panic!{C.RESET}")
+
+    pause()
+
+    # ─── Resolve the conflict ───
+    clear()
+    banner("BOSS FIGHT — STEP 3: RESOLVE IT")
+
+    instruction("Look at what's inside hero.txt:")
+    show_command("cat hero.txt")
+
+    content = read_file("hero.txt")
+    print(f"\n  {C.DIM}File contents:{C.RESET}")
+    for line in content.split("\n"):
+        if "<<<<<<<" in line:
+            print(f"  {C.RED}{line}  ← YOUR branch (main) starts here{C.RESET}")
+        elif "=======" in line:
+            print(f"  {C.GOLD}{line}  ← Divider between versions{C.RESET}")
+        elif ">>>>>>>" in line:
+            print(f"  {C.BLUE}{line}  ← Other branch ends here{C.RESET}")
+        else:
+            print(f"  {C.BOLD}{line}{C.RESET}")
+
+    wait_for_command("Press ENTER when you've seen the markers: ")
+
+    print(f"""
+  {C.BOLD}
+  YOUR JOB: Delete the markers and keep what you want.
+  Let's combine both — make a Fire-Ice Battle Mage!{C.RESET}
+""")
+
+    instruction("Replace the file with your resolved version:")
+    show_command('echo "Hero Class: Fire-Ice Battle Mage" > hero.txt')
+
+    expect(lambda cmd: "hero" in cmd.lower(), 'Type: echo "Hero Class: Fire-Ice Battle Mage" > hero.txt')
+    write_file("hero.txt", "Hero Class: Fire-Ice Battle Mage\n")
+    success("Conflict resolved! You chose your own path!")
+
+    instruction("Tell Git you fixed it:")
+    show_command("git add hero.txt")
+
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hero.txt")
+    play(cmd, "add", "hero.txt", check=staged("hero.txt"))
+    success("Marked as resolved!")
+
+    instruction("Complete the merge:")
+    show_command('git commit -m "Merge: combine fire and ice into Battle Mage"')
+
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "Merge: combine fire and ice into Battle Mage"')
+    play(cmd, "commit", "-m", "Merge: combine fire and ice into Battle Mage", check=head_moved())
+
+    run_git("branch", "-d", "fire-upgrade")
+
+    clear()
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║           ☠️  BOSS DEFEATED!  ☠️                   ║
+    ║                                                  ║
+    ║   You resolved a merge conflict!                 ║
+    ║   It's just:                                     ║
+    ║                                                  ║
+    ║   1. Edit the file (remove markers)              ║
+    ║   2. git add <file>                              ║
+    ║   3. git commit                                  ║
+    ║                                                  ║
+    ║   That's it. Never be scared again.              ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+    award_xp(100, "MERGE CONFLICT BOSS DEFEATED!")
+    achievement("Conflict Resolver")
+    achievement("Branch Master")
+
+    show_xp()
+    pause("Press ENTER to continue to Level 4...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 4: THE CLOUD KINGDOM
+# ═══════════════════════════════════════════════════════
+def level_4_intro():
+    clear()
+    banner("LEVEL 4: THE CLOUD KINGDOM  ⭐ 300 XP")
+
+    print(f"""
+  {C.BOLD}Everything so far has been LOCAL (on your computer).{C.RESET}
+
+  Now we connect to GitHub — the cloud.
+
+  {C.CYAN}git push{C.RESET}  = Upload your commits to GitHub
+  {C.CYAN}git pull{C.RESET}  = Download commits from GitHub
+  {C.CYAN}git clone{C.RESET} = Copy entire repo from GitHub
+
+  {C.DIM}You need a GitHub account for this level.
+  If you don't have one, go to github.com and create one (free).{C.RESET}
+""")
+
+    print(f"\n  {C.BOLD}Do you have a GitHub account?{C.RESET}")
+    print(f"  {C.DIM}(If not, the game will teach the concepts and you can")
+    print(f"   try the commands later when you have an account){C.RESET}")
+
+    answer = read_input(f"\n  {C.CYAN}Type 'yes' or 'no': {C.RESET}").strip().lower()
+
+    if answer in ["yes", "y"]:
+        clear()
+        banner("LEVEL 4 — LAB 1: CONNECT TO GITHUB")
+        mission("Push your git-quest to GitHub.")
+
+        print(f"""
+  {C.BOLD}Step 1:{C.RESET} Go to github.com
+  {C.BOLD}Step 2:{C.RESET} Click "+" → "New repository"
+  {C.BOLD}Step 3:{C.RESET} Name it: git-quest
+  {C.BOLD}Step 4:{C.RESET} Do NOT check "Add README"
+  {C.BOLD}Step 5:{C.RESET} Click "Create repository"
+  {C.BOLD}Step 6:{C.RESET} Copy the URL (https://github.com/YOU/git-quest.git)
+""")
+        url = read_input(f"\n  {C.CYAN}Paste your GitHub URL here: {C.RESET}").strip()
+
+        if url:
+            instruction("Add the remote:")
+            show_command(f"git remote add origin {url}")
+
+            cmd = expect(lambda cmd: "remote" in cmd and "add" in cmd, f"Type: git remote add origin {url}")
+            play(cmd, "remote", "add", "origin", url, check=lambda: run_git("remote", "get-url", "origin")[0])
+            success("Remote added!")
+
+            instruction("Push to GitHub:")
+            show_command("git push -u origin main")
+
+            cmd = expect(lambda cmd: "push" in cmd, "Type: git push -u origin main")
+            print(f"\n  {C.DIM}Pushing... (this may ask for credentials, Ctrl+C to give up){C.RESET}")
+            ok, out = play(cmd, "push", "-u", "origin", "main", timeout=300, may_fail=True)
+            if ok:
+                success("YOUR CODE IS ON GITHUB! 🎉 Go check it in your browser!")
+                achievement("Cloud Warrior")
+                award_xp(100, "Pushed to GitHub!")
+            else:
+                print(f"\n  {C.DIM}{out}{C.RESET}")
+                print(f"\n  {C.GOLD}If this failed, you may need to:")
+                print(f"  - Create a Personal Access Token on GitHub")
+                print(f"  - Settings → Developer Settings → Tokens{C.RESET}")
+                award_xp(50, "Attempted push (setup needed)")
+        else:
+            print(f"\n  {C.DIM}No URL provided. That's fine — we'll cover the concepts.{C.RESET}")
+            award_xp(50, "Remote concepts learned")
+
+    else:
+        award_xp(50, "Remote concepts learned")
+
+    pause()
+
+# ─── Level Complete: The Daily Workflow ───
+def level_4_complete():
+    clear()
+    banner("LEVEL 4 — THE DAILY WORKFLOW")
+
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  YOUR DAILY ROUTINE WITH GITHUB:                 ║
+    ║                                                  ║
+    ║  Morning:                                        ║
+    ║    git pull              ← Get latest changes    ║
+    ║                                                  ║
+    ║  During work:                                    ║
+    ║    git add .             ← Stage                 ║
+    ║    git commit -m "msg"   ← Commit                ║
+    ║                                                  ║
+    ║  End of day:                                     ║
+    ║    git push              ← Upload to GitHub      ║
+    ║                                                  ║
+    ║  That's the whole routine!                       ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+
+    print(f"""
+  {C.BOLD}Key commands:{C.RESET}
+
+  {C.CYAN}git clone <url>{C.RESET}        Download a repo for the first time
+  {C.CYAN}git push{C.RESET}               Upload your commits
+  {C.CYAN}git pull{C.RESET}               Download + merge latest changes
+  {C.CYAN}git remote -v{C.RESET}          See your remote connections
+  {C.CYAN}git push -u origin main{C.RESET} First push (sets up tracking)
+""")
+
+    award_xp(100, "Cloud Kingdom concepts mastered")
+    show_xp()
+    pause("Press ENTER to continue to the FINAL LEVEL...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 5: THE FINAL BOSS
+# ═══════════════════════════════════════════════════════
+def level_5_intro():
+    clear()
+    banner("LEVEL 5: THE FINAL BOSS  ⭐ 500 XP")
+
+    story("You've come far. Now learn emergency recovery")
+    story("and the advanced spells that make you a Git ninja.")
+    pause()
+
+# ─── LAB 1: Stash ───
+def level_5_lab_1():
+    clear()
+    banner("LEVEL 5 — LAB 1: THE STASH SPELL")
+    mission("Save work temporarily without committing.")
+
+    print(f"""
+  {C.BOLD}Scenario:{C.RESET} You're working on something, but suddenly
+  need to switch branches. Your work isn't ready to commit.
+
+  {C.CYAN}git stash{C.RESET}     = Hide your changes temporarily
+  {C.CYAN}git stash pop{C.RESET} = Bring them back
+""")
+
+    instruction("Start some work:")
+    show_command('echo "World Map - Forest Region" > map.txt')
+
+    expect(lambda cmd: "map" in cmd.lower(), 'Type: echo "World Map - Forest Region" > map.txt')
+    write_file("map.txt", "World Map - Forest Region\n")
+    success("Map started!")
+
+    instruction("Stash it (hide temporarily):")
+    show_command("git stash")
+
+    expect(lambda cmd: cmd.strip() == "git stash" or "stash" in cmd, "Type: git stash")
+    run_git("add", "map.txt")
+    ok, out = run_git("stash")
+    print(f"  {C.DIM}{out}{C.RESET}")
+    success("Changes stashed! Your working directory is clean.")
+
+    print(f"\n  {C.BOLD}map.txt is hidden. Check:{C.RESET}")
+    exists = check_file_exists("map.txt")
+    if not exists:
+        print(f"  {C.RED}map.txt = GONE (stashed safely){C.RESET}")
+
+    instruction("Bring it back:")
+    show_command("git stash pop")
+
+    cmd = expect(lambda cmd: "stash" in cmd and "pop" in cmd, "Type: git stash pop")
+    play(cmd, "stash", "pop", check=lambda: check_file_exists("map.txt"))
+    if check_file_exists("map.txt"):
+        success("map.txt is BACK! Stash is powerful! 💪")
+    award_xp(50, "Stash spell mastered")
+
+    # Commit map
+    run_git("add", "map.txt")
+    run_git("commit", "-m", "Add world map")
+
+    pause()
+
+# ─── LAB 2: Emergency Recovery ───
+def level_5_lab_2():
+    clear()
+    banner("LEVEL 5 — LAB 2: EMERGENCY RECOVERY")
+    mission("Recover from disasters.")
+
+    print(f"\n  {C.BOLD}Emergency 1: Accidentally deleted a file{C.RESET}")
+
+    instruction("Delete warrior.txt 'by accident':")
+    show_command("rm warrior.txt")
+
+    expect(lambda cmd: "rm" in cmd or "del" in cmd or "remove" in cmd, "Type: rm warrior.txt (or del warrior.txt on Windows)")
+    delete_file("warrior.txt")
+    success("warrior.txt DELETED! 😱")
+
+    instruction("RESTORE it from Git:")
+    show_command("git restore warrior.txt")
+
+    cmd = expect(lambda cmd: "restore" in cmd and "warrior" in cmd, "Type: git restore warrior.txt")
+    play(cmd, "restore", "warrior.txt", check=lambda: "warrior.txt" not in repo_snapshot().modified)
+    if check_file_exists("warrior.txt"):
+        success("warrior.txt is BACK! Git never forgets! 🎉")
+        award_xp(40, "File recovery mastered")
+
+    pause()
+
+# ─── Emergency 2: Bad commit ───
+def level_5_lab_3():
+    clear()
+    banner("LEVEL 5 — LAB 3: UNDO A BAD COMMIT")
+    mission("Remove a commit you didn't want.")
+
+    instruction("Make a bad commit:")
+    show_command('echo "GARBAGE DATA" > oops.txt')
+
+    expect(lambda cmd: "oops" in cmd.lower() or "garbage" in cmd.lower(), 'Type: echo "GARBAGE DATA" > oops.txt')
+    write_file("oops.txt", "GARBAGE DATA\n")
+    success("Bad file created!")
+
+    show_command("git add oops.txt")
+    cmd = expect(lambda cmd: "add" in cmd, "Type: git add oops.txt")
+    play(cmd, "add", "oops.txt", check=staged("oops.txt"))
+
+    show_command('git commit -m "Oops bad commit"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "Oops bad commit"')
+    play(cmd, "commit", "-m", "Oops bad commit", check=head_moved())
+    success("Bad commit made. Now UNDO it!")
+
+    instruction("Undo the commit (keep files):")
+    show_command("git reset --soft HEAD~1")
+
+    cmd = expect(lambda cmd: "reset" in cmd, "Type: git reset --soft HEAD~1")
+    play(cmd, "reset", "--soft", "HEAD~1", check=head_moved())
+    success("Commit UNDONE! The file is still here but uncommitted.")
+    award_xp(40, "Commit recovery mastered")
+
+    # Clean up
+    run_git("restore", "--staged", "oops.txt")
+    delete_file("oops.txt")
+
+    pause()
+
+# ─── LAB 4: Reflog ───
+def level_5_lab_4():
+    clear()
+    banner("LEVEL 5 — LAB 4: THE REFLOG — YOUR SAFETY NET")
+    mission("See EVERYTHING that ever happened.")
+
+    instruction("Type the ultimate safety net command:")
+    show_command("git reflog")
+
+    cmd = expect(lambda cmd: "reflog" in cmd, "Type: git reflog")
+    ok, out = play(cmd, "reflog")
+    lines = out.split("\n")[:10]
+    for line in lines:
+        print(f"  {C.GREEN}{line}{C.RESET}")
+    print(f"\n  {C.BOLD}This shows EVERY action — even deleted commits!{C.RESET}")
+    print(f"  {C.BOLD}You can recover ANYTHING with: git checkout <hash>{C.RESET}")
+    achievement("Rescue Ranger")
+    award_xp(40, "Reflog mastered")
+
+    pause()
+
+# ─── LAB 5: Aliases ───
+def level_5_lab_5():
+    clear()
+    banner("LEVEL 5 — LAB 5: POWER-UP — GIT ALIASES")
+    mission("Create shortcuts for commands you use all the time.")
+
+    instruction("Create a shortcut for 'git status':")
+    show_command("git config --global alias.st status")
+
+    cmd = expect(lambda cmd: "alias" in cmd, "Type: git config --global alias.st status")
+    while not run_typed_command(cmd):
+        cmd = expect(*last_expect)
+    success("Alias created!")
+
+    instruction("Create a shortcut for the visual log:")
+    show_command('git config --global alias.lg "log --oneline --graph --all"')
+
+    cmd = expect(lambda cmd: "alias" in cmd and "lg" in cmd, 'Type: git config --global alias.lg "log --oneline --graph --all"')
+    while not run_typed_command(cmd):
+        cmd = expect(*last_expect)
+    success("Alias created!")
+
+    instruction("Try your new shortcuts:")
+    show_command("git st")
+
+    cmd = expect(lambda cmd: "git st" in cmd or "git lg" in cmd, "Type: git st")
+    ok, out = play(cmd, cmd.replace("git ", ""))
+    print(f"  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("Shortcuts working! So much faster! ⚡")
+    award_xp(30, "Aliases configured")
+
+    pause()
+
+# ─── The Complete Mental Model ───
+def level_5_complete():
+    clear()
+    banner("THE COMPLETE GIT MENTAL MODEL")
+
+    print(f"""
+{C.GOLD}
+  ┌────────────────────────────────────────────────────────┐
+  │                                                        │
+  │   YOUR DAILY LIFE WITH GIT:                            │
+  │                                                        │
+  │   1. git pull              ← Get latest                │
+  │   2. git checkout -b feat  ← Branch for your work      │
+  │   3. ... edit files ...    ← Do your thing             │
+  │   4. git add .             ← Stage changes             │
+  │   5. git commit -m "msg"   ← Save snapshot             │
+  │   6. ... repeat 3-5 ...    ← Keep working              │
+  │   7. git checkout main     ← Switch to main            │
+  │   8. git merge feat        ← Merge your work           │
+  │   9. git push              ← Upload to GitHub          │
+  │   10. git branch -d feat   ← Clean up                  │
+  │                                                        │
+  │   THAT'S IT. THAT'S 95% OF GIT.                        │
+  │                                                        │
+  └────────────────────────────────────────────────────────┘
+{C.RESET}""")
+
+    award_xp(100, "FINAL BOSS COMPLETE!")
+    show_xp()
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 6: THE GUILD (Team Workflow)
+# ═══════════════════════════════════════════════════════
+def level_6_intro():
+    clear()
+    banner("LEVEL 6: THE GUILD  ⭐ 600 XP")
+
+    print(f"""
+  {C.BOLD}Welcome to the real world, developer.{C.RESET}
+
+  In companies, you don't work alone. Teams of 5, 10, 50
+  developers all push to the SAME repository.
+
+  {C.CYAN}How do you avoid chaos?{C.RESET}
+
+  With CONVENTIONS — rules everyone agrees on.
+  This level teaches you the workflows real teams use.
+""")
+    pause()
+
+# ─── LAB 1: Branch Naming Conventions ───
+def level_6_lab_1():
+    clear()
+    banner("LEVEL 6 — LAB 1: BRANCH NAMING CONVENTIONS")
+    mission("Learn how professional teams name branches.")
+
+    print(f"""
+  {C.BOLD}In companies, branches follow naming rules:{C.RESET}
+
+  {C.GREEN}feature/{C.RESET}user-login       New features
+  {C.GREEN}bugfix/{C.RESET}login-crash       Bug fixes
+  {C.GREEN}hotfix/{C.RESET}security-patch    Urgent production fixes
+  {C.GREEN}release/{C.RESET}v2.1.0           Release preparation
+  {C.GREEN}docs/{C.RESET}update-readme       Documentation changes
+
+  {C.DIM}Many teams also include ticket numbers:{C.RESET}
+  {C.GREEN}feature/{C.RESET}JIRA-1234-user-login
+
+  This way, anyone can tell what a branch is for
+  just by looking at its name.
+""")
+
+    instruction("Create a feature branch the professional way:")
+    show_command("git checkout -b feature/add-inventory")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd and ("feature/" in cmd or "feature\\" in cmd), "Type: git checkout -b feature/add-inventory")
+    branch = cmd.split()[-1] if len(cmd.split()) > 3 else "feature/add-inventory"
+    play(cmd, "checkout", "-b", branch, check=on_branch(branch))
+    success(f"Professional branch created: {branch}")
+    award_xp(30, "Branch naming conventions")
+
+    instruction("Add some work on this feature:")
+    show_command('echo "Inventory: Sword, Shield, Potion" > inventory.txt')
+
+    expect(lambda cmd: "inventory" in cmd.lower(), 'Type: echo "Inventory: Sword, Shield, Potion" > inventory.txt')
+    write_file("inventory.txt", "Inventory: Sword, Shield, Potion\n")
+    success("Inventory file created!")
+
+    show_command("git add inventory.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add inventory.txt")
+    play(cmd, "add", "inventory.txt", check=staged("inventory.txt"))
+
+    print(f"""
+  {C.BOLD}Pro tip — Conventional Commit Messages:{C.RESET}
+
+  Most companies use this format:  {C.CYAN}type: description{C.RESET}
+
+  {C.GREEN}feat:{C.RESET}     New feature          {C.GREEN}fix:{C.RESET}      Bug fix
+  {C.GREEN}docs:{C.RESET}     Documentation        {C.GREEN}refactor:{C.RESET} Code restructure
+  {C.GREEN}test:{C.RESET}     Adding tests          {C.GREEN}chore:{C.RESET}    Maintenance
+""")
+
+    instruction("Commit with a conventional message:")
+    show_command('git commit -m "feat: add inventory system"')
+
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "feat: add inventory system"')
+    msg = cmd.split("-m")[-1].strip().strip('"').strip("'") if "-m" in cmd else "feat: add inventory system"
+    if not msg:
+        msg = "feat: add inventory system"
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("Committed with professional format!")
+    award_xp(20, "Conventional commit")
+
+    pause()
+
+# ─── LAB 2: Simulating a Teammate ───
+SARAH_MAIN_COMMITS = [
+    ("feat: add API module (by Sarah)",
+     {"api.txt": "API Module - handles HTTP requests\nEndpoint: /users GET\nEndpoint: /login POST\n"}),
+    ("feat: add database schema (by Sarah)",
+     {"database.txt": "Database: PostgreSQL\nTable: users (id, name, email)\nTable: sessions (id, user_id, token)\n"}),
+]
+
+def level_6_lab_2():
+    clear()
+    banner("LEVEL 6 — LAB 2: WORKING WITH TEAMMATES")
+    mission("See what happens when a coworker pushes to main.")
+
+    print(f"""
+  {C.BOLD}Real scenario:{C.RESET}
+
+  You're on your feature branch, working away.
+  Meanwhile, your teammate Sarah pushes new code to main.
+
+  {C.RED}Your branch is now BEHIND main.{C.RESET}
+
+  This happens EVERY DAY in real teams.
+  Let's simulate it.
+""")
+
+    instruction("Switch to main:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+    success("On main!")
+
+    story("(Simulating Sarah's work on main...)")
+    suspense(1)
+
+    seed_commits(SARAH_MAIN_COMMITS, author=SARAH)
+
+    print(f"\n  {C.GREEN}Sarah made 2 commits on main while you were working!{C.RESET}")
+
+    instruction("Check the log to see Sarah's commits:")
+    show_command("git log --oneline -5")
+
+    cmd = expect(lambda cmd: "log" in cmd, "Type: git log --oneline -5")
+    ok, out = play(cmd, "log", "--oneline", "-5")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("See Sarah's commits? Main moved ahead without you!")
+
+    instruction("Switch back to your feature branch:")
+    show_command("git checkout feature/add-inventory")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "feature" in cmd, "Type: git checkout feature/add-inventory")
+    play(cmd, "checkout", "feature/add-inventory", check=on_branch("feature/add-inventory"))
+    success("Back on your feature branch!")
+
+    print(f"\n  {C.RED}Your branch does NOT have Sarah's commits!{C.RESET}")
+    print(f"  {C.BOLD}You need to get up to date before your code can be merged.{C.RESET}")
+    award_xp(30, "Team simulation")
+
+    pause()
+
+# ─── LAB 3: Staying Up to Date ───
+def level_6_lab_3():
+    clear()
+    banner("LEVEL 6 — LAB 3: STAYING UP TO DATE")
+    mission("Merge main into your branch to get teammates' changes.")
+
+    print(f"""
+  {C.BOLD}Two ways to stay current:{C.RESET}
+
+  {C.CYAN}Option A: git merge main{C.RESET}
+    Brings main's changes into your branch
+    Creates a merge commit
+    {C.GREEN}Safer, easier for beginners{C.RESET}
+
+  {C.CYAN}Option B: git rebase main{C.RESET}
+    Replays your commits on top of main
+    Cleaner history (no merge commit)
+    {C.GOLD}Advanced — we'll use merge for now{C.RESET}
+
+  {C.DIM}Most teams prefer one or the other. Both are valid.{C.RESET}
+""")
+
+    instruction("Merge main into your feature branch:")
+    show_command("git merge main")
+
+    cmd = expect(lambda cmd: "merge" in cmd and "main" in cmd, "Type: git merge main")
+    ok, out = play(cmd, "merge", "main", check=merged("main"))
+    print(f"\n  {C.DIM}{out}{C.RESET}")
+    success("Your branch now has Sarah's changes PLUS your own work!")
+    award_xp(40, "Branch sync mastered")
+
+    instruction("Verify — you should have everything:")
+    show_command("git log --oneline --graph -6")
+
+    cmd = expect(lambda cmd: "log" in cmd, "Type: git log --oneline --graph -6")
+    ok, out = play(cmd, "log", "--oneline", "--graph", "-6")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}You have it all! Sarah's API & DB + your inventory.{C.RESET}")
+
+    pause()
+
+# ─── LAB 4: Git Blame ───
+def level_6_lab_4():
+    clear()
+    banner("LEVEL 6 — LAB 4: GIT BLAME — WHO WROTE THIS?")
+    mission("Find out who wrote each line in a file.")
+
+    print(f"""
+  {C.BOLD}Scenario:{C.RESET} You found a bug in the API module.
+  You need to know WHO wrote that line so you can ask them.
+
+  {C.CYAN}git blame <file>{C.RESET} shows who last modified each line.
+
+  {C.DIM}(The API lines show Sarah: the game committed her
+   simulated work under her name.){C.RESET}
+""")
+
+    instruction("Blame the API file:")
+    show_command("git blame api.txt")
+
+    cmd = expect(lambda cmd: "blame" in cmd, "Type: git blame api.txt")
+    ok, out = play(cmd, "blame", "api.txt")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}Each line shows: commit | author | date | content{C.RESET}")
+    print(f"  {C.DIM}Now you know who to ask about the API bug!{C.RESET}")
+    award_xp(30, "Git blame mastered")
+    achievement("Detective")
+
+    pause()
+
+# ─── LAB 5: Cherry-Pick ───
+SARAH_BRANCH_COMMITS = [
+    ("feat: add logging module",
+     {"logging.txt": "Logger: console output\nLevel: INFO\n"}),
+    ("fix: patch XSS vulnerability",
+     {"security-patch.txt": "CRITICAL FIX: patch XSS vulnerability in login form\n"}),
+    ("wip: experimental feature (not ready)",
+     {"experimental.txt": "Experimental feature - WIP do not merge\n"}),
+]
+
+def level_6_lab_5():
+    clear()
+    banner("LEVEL 6 — LAB 5: CHERRY-PICK — STEAL ONE COMMIT")
+    mission("Take ONE specific commit from another branch.")
+
+    print(f"""
+  {C.BOLD}Scenario:{C.RESET} A coworker made a critical bugfix on THEIR
+  feature branch. You need that fix NOW on main, but
+  you don't want their whole branch — just that ONE commit.
+
+  {C.CYAN}git cherry-pick <hash>{C.RESET} copies a single commit
+  to your current branch.
+
+  {C.DIM}This is used ALL the time for hotfixes in real companies!{C.RESET}
+""")
+
+    # Merge current feature to main first, then set up scenario
+    run_git("checkout", "main")
+    run_git("merge", "feature/add-inventory")
+    run_git("branch", "-d", "feature/add-inventory")
+
+    # Create Sarah's branch with a mix of commits
+    run_git("checkout", "-b", "feature/sarah-logging")
+    seed_commits(SARAH_BRANCH_COMMITS, author=SARAH)
+
+    # Get the hash of the security fix commit
+    ok, fix_log = run_git("rev-parse", "--short", "HEAD~1")
+    fix_hash = fix_log.strip() if ok else "abc1234"
+
+    print(f"\n  {C.BOLD}Sarah's branch has 3 commits:{C.RESET}")
+
+    instruction("Look at Sarah's commits:")
+    show_command("git log --oneline -3")
+
+    cmd = expect(lambda cmd: "log" in cmd, "Type: git log --oneline -3")
+    ok, out = play(cmd, "log", "--oneline", "-3")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}We ONLY want the security fix (commit {C.CYAN}{fix_hash}{C.BOLD}).{C.RESET}")
+
+    instruction("Go back to main:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+
+    instruction(f"Cherry-pick JUST the security fix:")
+    show_command(f"git cherry-pick {fix_hash}")
+
+    cmd = expect(lambda cmd: "cherry-pick" in cmd, f"Type: git cherry-pick {fix_hash}")
+    hash_to_pick = cmd.split()[-1] if len(cmd.split()) > 2 else fix_hash
+    ok, out = play(cmd, "cherry-pick", hash_to_pick, check=head_moved())
+    if ok:
+        success("Security fix cherry-picked onto main!")
+        print(f"  {C.BOLD}The logging and experimental commits stayed on Sarah's branch.{C.RESET}")
+    else:
+        print(f"  {C.DIM}{out}{C.RESET}")
+        run_git("cherry-pick", fix_hash)
+        success("Cherry-picked!")
+    award_xp(50, "Cherry-pick mastered")
+
+    # Clean up
+    run_git("branch", "-D", "feature/sarah-logging")
+
+# ─── Level Complete ───
+def level_6_complete():
+    clear()
+    banner("LEVEL 6 COMPLETE!")
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  TEAM WORKFLOW MASTERED:                         ║
+    ║                                                  ║
+    ║  • feature/ branch naming    Company convention  ║
+    ║  • Conventional commits      Team standard       ║
+    ║  • Simulating teammates      Real-world flow     ║
+    ║  • git merge main            Stay up to date     ║
+    ║  • git blame                 Who wrote this?     ║
+    ║  • git cherry-pick           Steal one commit    ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+
+    achievement("Team Player")
+    show_xp()
+    pause("Press ENTER to continue to Level 7: THE WAR ROOM...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 7: THE WAR ROOM (Code Review & Clean History)
+# ═══════════════════════════════════════════════════════
+def level_7_intro():
+    clear()
+    banner("LEVEL 7: THE WAR ROOM  ⭐ 500 XP")
+
+    print(f"""
+  {C.BOLD}In real companies, code doesn't just go to main.{C.RESET}
+
+  It goes through CODE REVIEW first.
+
+  Before your code is merged, teammates:
+  • Read your changes (the diff)
+  • Leave comments
+  • Request changes
+  • Approve it
+
+  {C.CYAN}Your job: make your commits CLEAN and REVIEWABLE.{C.RESET}
+  {C.DIM}Messy commits = angry reviewers = slow merges!{C.RESET}
+""")
+    pause()
+
+# ─── LAB 1: Squashing Commits ───
+MESSY_COMMITS = [
+    ("wip dashboard", {"dashboard.txt": "Dashboard v1\n"}),
+    ("add charts idk", {"dashboard.txt": "Dashboard v1\nCharts: bar, line\n"}),
+    ("more stuff", {"dashboard.txt": "Dashboard v1\nCharts: bar, line, pie\nFilters: date, user\n"}),
+    ("ok final version hopefully",
+     {"dashboard.txt": "Dashboard v2\nCharts: bar, line, pie\nFilters: date, user, status\nExport: CSV, PDF\n"}),
+]
+
+def level_7_lab_1():
+    clear()
+    banner("LEVEL 7 — LAB 1: SQUASH — CLEAN UP YOUR MESS")
+    mission("Turn multiple messy commits into one clean commit.")
+
+    print(f"""
+  {C.BOLD}Real scenario:{C.RESET}
+
+  You're working on a feature. You make commits like:
+
+  {C.RED}  "wip"
+  "fix typo"
+  "oops forgot a file"
+  "actually fix it this time"
+  "final fix for real"{C.RESET}
+
+  Your reviewer does NOT want to see that mess.
+
+  {C.CYAN}git merge --squash{C.RESET} combines all commits from a
+  branch into ONE clean commit when merging to main.
+""")
+
+    instruction("Create a messy feature branch:")
+    show_command("git checkout -b feature/messy-work")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd, "Type: git checkout -b feature/messy-work")
+    play(cmd, "checkout", "-b", "feature/messy-work", check=on_branch("feature/messy-work"))
+    success("On feature branch!")
+
+    story("Let's simulate messy development...")
+    suspense(0.5)
+
+    seed_commits(MESSY_COMMITS)
+
+    print(f"\n  {C.RED}Look at this messy history:{C.RESET}")
+    ok, out = run_git("log", "--oneline", "-4")
+    print(f"\n  {C.RED}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}Nobody wants to review 4 messy commits! Let's fix it.{C.RESET}")
+
+    pause()
+
+    instruction("Switch to main:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+
+    instruction("Squash merge — combines all 4 commits into ONE:")
+    show_command("git merge --squash feature/messy-work")
+
+    cmd = expect(lambda cmd: "merge" in cmd and "squash" in cmd, "Type: git merge --squash feature/messy-work")
+    ok, out = play(cmd, "merge", "--squash", "feature/messy-work", check=lambda: bool(repo_snapshot().staged))
+    print(f"  {C.DIM}{out}{C.RESET}")
+    success("All changes staged but NOT committed yet!")
+    print(f"  {C.BOLD}Now write ONE clean message for all that work:{C.RESET}")
+
+    instruction("Write the clean commit message:")
+    show_command('git commit -m "feat: add dashboard with charts, filters, and export"')
+
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "feat: add dashboard with charts, filters, and export"')
+    msg = "feat: add dashboard with charts, filters, and export"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("ONE clean commit instead of 4 messy ones! ✨")
+    award_xp(50, "Squash merge mastered")
+    achievement("Clean Coder")
+
+    run_git("branch", "-D", "feature/messy-work")
+
+    pause()
+
+# ─── LAB 2: Git Bisect ───
+BISECT_COMMITS = [
+    ("v1.0: initial release", {"app.txt": "App v1.0 - Working\n"}),
+    ("v1.1: add search feature", {"app.txt": "App v1.1 - Added search\n"}),
+    ("v1.2: add filters", {"app.txt": "App v1.2 - Added filters\n"}),
+    # The bad commit
+    ("v1.3: refactor database layer", {"app.txt": "App v1.3 - BUG INTRODUCED HERE\n"}),
+    ("v1.4: add export feature", {"app.txt": "App v1.4 - Added export (still has BUG)\n"}),
+    ("v1.5: add settings page", {"app.txt": "App v1.5 - Added settings (still has BUG)\n"}),
+]
+
+BISECT_CULPRIT = next(message for message, files in BISECT_COMMITS if "BUG" in files["app.txt"])
+
+def level_7_lab_2():
+    clear()
+    banner("LEVEL 7 — LAB 2: GIT BISECT — HUNT THE BUG")
+    mission("Use binary search to find which commit broke things.")
+
+    print(f"""
+  {C.BOLD}Scenario:{C.RESET} Something is broken. You have 100 commits.
+  Which one introduced the bug?
+
+  Checking each one manually = {C.RED}100 checks{C.RESET}
+  Using git bisect            = {C.GREEN}~7 checks!{C.RESET} (binary search)
+
+  {C.CYAN}git bisect{C.RESET} does a binary search through your
+  commit history. You tell it "good" or "bad" and
+  it narrows down the exact broken commit.
+""")
+
+    story("Let's create history with a hidden bug...")
+    suspense(0.5)
+
+    seed_commits(BISECT_COMMITS)
+
+    ok, log_out = run_git("log", "--oneline", "-6")
+    commits = log_out.strip().split("\n")
+
+    print(f"\n  {C.BOLD}Commit History:{C.RESET}")
+    for c in commits:
+        print(f"    {C.DIM}{c}{C.RESET}")
+
+    print(f"""
+  {C.RED}The app is broken!{C.RESET} Something went wrong between
+  v1.0 (which worked) and v1.5 (which is broken).
+
+  {C.BOLD}Let's use bisect to find the exact bad commit.{C.RESET}
+""")
+
+    instruction("Start the bisect hunt:")
+    show_command("git bisect start")
+
+    cmd = expect(lambda cmd: "bisect" in cmd and "start" in cmd, "Type: git bisect start")
+    ok, out = play(cmd, "bisect", "start")
+    success("Bisect mode activated!")
+
+    instruction("Tell Git the current state is BAD (broken):")
+    show_command("git bisect bad")
+
+    cmd = expect(lambda cmd: "bisect" in cmd and "bad" in cmd, "Type: git bisect bad")
+    ok, out = play(cmd, "bisect", "bad")
+    print(f"  {C.DIM}{out}{C.RESET}")
+    success("Current marked as bad!")
+
+    # The root commit predates the app, so it is known good
+    ok, roots = run_git("rev-list", "--max-parents=0", "--abbrev-commit", "HEAD")
+    first_hash = roots.split()[-1] if ok and roots else "HEAD~6"
+
+    instruction(f"Tell Git a known-good commit (the first one):")
+    show_command(f"git bisect good {first_hash}")
+
+    cmd = expect(lambda cmd: "bisect" in cmd and "good" in cmd, f"Type: git bisect good {first_hash}")
+    hash_arg = cmd.split()[-1] if len(cmd.split()) > 3 else first_hash
+    ok, out = play(cmd, "bisect", "good", hash_arg)
+    print(f"  {C.DIM}{out}{C.RESET}")
+    success("Git jumped to the middle! Now testing...")
+
+    # Hand the remaining steps to a test script
+    print(f"""
+  {C.BOLD}Marking every step by hand gets old fast.{C.RESET} Give bisect a
+  script instead: exit 0 means good, exit 1 means bad, and
+  {C.CYAN}git bisect run{C.RESET} tests each commit it lands on by itself.
+""")
+    script = write_bisect_check(os.path.join(session.quest_dir, ".git"))
+
+    instruction("Let the script finish the hunt:")
+    show_command("git bisect run python .git/check_app.py")
+
+    cmd = expect(lambda cmd: "bisect" in cmd and "run" in cmd, "Type: git bisect run python .git/check_app.py")
+    ok, out = play(cmd, "bisect", "run", sys.executable, script)
+    for line in out.split("\n"):
+        if line.startswith("[") or "is the first bad commit" in line:
+            print(f"    {C.DIM}{line.strip()}{C.RESET}")
+    ok, culprit = run_git("log", "-1", "--format=%s", "refs/bisect/bad")
+    replay_expect(culprit == BISECT_CULPRIT, f"bisect named {culprit!r}, not {BISECT_CULPRIT!r}")
+    if culprit == BISECT_CULPRIT:
+        tested = out.count("running ")
+        success(f"FOUND IT! The script tested {tested} commits and Git named the bad one! 🎯")
+    else:
+        fail(f"Bisect stopped at \"{culprit}\" — the bug came in with \"{BISECT_CULPRIT}\".")
+
+    award_xp(60, "Git bisect mastered")
+    achievement("Bug Hunter")
+
+    run_git("bisect", "reset")
+    print(f"\n  {C.DIM}Feel the log2 on a real monorepo: python git-quest.py --drill 100000{C.RESET}")
+
+    pause()
+
+# ─── LAB 3: Diff Like a Pro ───
+REWRITE_COMMITS = [
+    ("feat: complete app v2.0 rewrite",
+     {"app.txt": "App v2.0 - Complete rewrite\nModules: auth, dashboard, api, database\nStatus: production ready\n"}),
+]
+
+def level_7_lab_3():
+    clear()
+    banner("LEVEL 7 — LAB 3: REVIEW DIFFS LIKE A PRO")
+    mission("Master the diff commands code reviewers use.")
+
+    print(f"""
+  {C.BOLD}When reviewing code (yours or a teammate's), you need:{C.RESET}
+
+  {C.CYAN}git diff --stat{C.RESET}          Quick overview (files + lines changed)
+  {C.CYAN}git diff --name-only{C.RESET}     Just the file names
+  {C.CYAN}git show <hash>{C.RESET}          See a specific commit's changes
+  {C.CYAN}git log --oneline -5{C.RESET}     Recent commits summary
+  {C.CYAN}git shortlog -sn{C.RESET}         Who committed how many times
+""")
+
+    # Make a change to review
+    seed_commits(REWRITE_COMMITS)
+
+    instruction("See a summary of what changed in the last commit:")
+    show_command("git diff --stat HEAD~1")
+
+    cmd = expect(lambda cmd: "diff" in cmd and "stat" in cmd, "Type: git diff --stat HEAD~1")
+    ok, out = play(cmd, "diff", "--stat", "HEAD~1")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("Quick overview! Files changed + lines added/removed.")
+    award_xp(30, "Diff stats mastered")
+
+    instruction("See the full details of the last commit:")
+    show_command("git show HEAD")
+
+    cmd = expect(lambda cmd: "show" in cmd, "Type: git show HEAD")
+    ok, out = play(cmd, "show", "--stat", "HEAD")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("git show is your go-to for inspecting any commit!")
+    award_xp(20, "Git show mastered")
+
+    instruction("See who contributed the most (great for team leads):")
+    show_command("git shortlog -sn")
+
+    cmd = expect(lambda cmd: "shortlog" in cmd, "Type: git shortlog -sn")
+    ok, out = play(cmd, "shortlog", "-sn", "HEAD")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("Now you can see who's been busy!")
+    award_xp(20, "Shortlog mastered")
+
+    pause()
+
+# ─── LAB 4: Creating a PR-Ready Branch ───
+NOTIFICATION_COMMITS = [
+    ("feat: add notification system with email, push, SMS",
+     {"notifications.txt": "Notification System\n- Email alerts\n- Push notifications\n- SMS for critical alerts\n- In-app notification center\n"}),
+    ("test: add notification system tests",
+     {"notification-tests.txt": "Tests for notifications\n- test_email_send: PASS\n- test_push_delivery: PASS\n- test_sms_fallback: PASS\n"}),
+]
+
+def level_7_lab_4():
+    clear()
+    banner("LEVEL 7 — LAB 4: THE PERFECT PULL REQUEST")
+    mission("Prepare a branch that's ready for code review.")
+
+    print(f"""
+  {C.BOLD}Before opening a Pull Request, pros always:{C.RESET}
+
+  1. {C.CYAN}Update with main{C.RESET}       git merge main
+  2. {C.CYAN}Fix any conflicts{C.RESET}      resolve + commit
+  3. {C.CYAN}Review own diff{C.RESET}        git diff main..HEAD
+  4. {C.CYAN}Squash if messy{C.RESET}        or keep clean commits
+  5. {C.CYAN}Write good PR title{C.RESET}    "feat: add user notifications"
+
+  {C.DIM}A good PR makes reviewers HAPPY.
+  A messy PR makes them close the tab.{C.RESET}
+""")
+
+    instruction("Let's create a clean PR branch:")
+    show_command("git checkout -b feature/user-notifications")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd, "Type: git checkout -b feature/user-notifications")
+    branch = cmd.split()[-1] if len(cmd.split()) > 3 else "feature/user-notifications"
+    play(cmd, "checkout", "-b", branch, check=on_branch(branch))
+    success("Feature branch created!")
+
+    seed_commits(NOTIFICATION_COMMITS)
+
+    instruction("Review your branch vs main (what the reviewer will see):")
+    show_command("git diff main --stat")
+
+    cmd = expect(lambda cmd: "diff" in cmd and "main" in cmd, "Type: git diff main --stat")
+    ok, out = play(cmd, "diff", "main", "--stat")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}This is exactly what appears on a GitHub Pull Request!{C.RESET}")
+    award_xp(30, "PR review skills")
+
+    instruction("Show your clean commit history for this branch:")
+    show_command("git log main..HEAD --oneline")
+
+    cmd = expect(lambda cmd: "log" in cmd and "main" in cmd, "Type: git log main..HEAD --oneline")
+    ok, out = play(cmd, "log", "main..HEAD", "--oneline")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    print(f"\n  {C.BOLD}Clean, clear commits. Your PR would be approved fast!{C.RESET}")
+    award_xp(20, "Clean PR history")
+
+    # Merge and clean up
+    run_git("checkout", "main")
+    run_git("merge", "feature/user-notifications")
+    run_git("branch", "-d", "feature/user-notifications")
+
+# ─── Level Complete ───
+def level_7_complete():
+    clear()
+    banner("LEVEL 7 COMPLETE!")
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  CODE REVIEW SKILLS MASTERED:                    ║
+    ║                                                  ║
+    ║  • git merge --squash        Clean up commits    ║
+    ║  • git bisect                Find bugs fast      ║
+    ║  • git diff --stat           Review like a pro   ║
+    ║  • git show                  Inspect commits     ║
+    ║  • git shortlog -sn          Team contributions  ║
+    ║  • git log main..HEAD        PR-ready review     ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+
+    show_xp()
+    pause("Press ENTER to continue to the FINAL Level 8: THE THRONE ROOM...")
+
+# ═══════════════════════════════════════════════════════
+# LEVEL 8: THE THRONE ROOM (Release Management)
+# ═══════════════════════════════════════════════════════
+def level_8_intro():
+    clear()
+    banner("LEVEL 8: THE THRONE ROOM  ⭐ 700 XP")
+
+    print(f"""
+  {C.BOLD}You've reached the top, developer.{C.RESET}
+
+  Companies don't just push code and hope for the best.
+  They have RELEASE PROCESSES.
+
+  This level teaches:
+  • Git tags for versioned releases
+  • Hotfix workflows for production emergencies
+  • The complete professional sprint cycle
+
+  {C.CYAN}This is what separates juniors from seniors.{C.RESET}
+""")
+    pause()
+
+# ─── LAB 1: Git Tags ───
+SEARCH_COMMITS = [
+    ("feat: add search module",
+     {"search.txt": "Search Module\n- Full-text search\n- Filters by date, type, author\n- Fuzzy matching\n"}),
+]
+
+def level_8_lab_1():
+    clear()
+    banner("LEVEL 8 — LAB 1: GIT TAGS — MARKING RELEASES")
+    mission("Create version tags for your releases.")
+
+    print(f"""
+  {C.BOLD}Semantic Versioning (SemVer):{C.RESET}
+
+  {C.CYAN}v MAJOR . MINOR . PATCH{C.RESET}
+  {C.CYAN}v   1   .   0   .   0  {C.RESET}
+
+  {C.GREEN}MAJOR{C.RESET} = Breaking changes       (v1 → v2)
+  {C.GREEN}MINOR{C.RESET} = New features            (v1.0 → v1.1)
+  {C.GREEN}PATCH{C.RESET} = Bug fixes               (v1.0.0 → v1.0.1)
+
+  {C.DIM}Examples:
+  v1.0.0  →  First stable release
+  v1.1.0  →  Added notification feature
+  v1.1.1  →  Fixed email delivery bug
+  v2.0.0  →  Major redesign (might break API){C.RESET}
+""")
+
+    instruction("Tag your current code as v1.0.0:")
+    show_command('git tag -a v1.0.0 -m "Release v1.0.0: initial stable release"')
+
+    cmd = expect(lambda cmd: "tag" in cmd, 'Type: git tag -a v1.0.0 -m "Release v1.0.0: initial stable release"')
+    ok, out = play(cmd, "tag", "-a", "v1.0.0", "-m", "Release v1.0.0: initial stable release", check=has_ref("refs/tags/v1.0.0"))
+    if not ok and "already exists" in str(out):
+        run_git("tag", "-d", "v1.0.0")
+        run_git("tag", "-a", "v1.0.0", "-m", "Release v1.0.0: initial stable release")
+    success("Tagged v1.0.0! This marks your first official release!")
+    award_xp(40, "First release tag")
+
+    instruction("See all your tags:")
+    show_command("git tag")
+
+    cmd = expect(lambda cmd: "tag" in cmd, "Type: git tag")
+    ok, out = play(cmd, "tag")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("Tags are like bookmarks for releases!")
+
+    # Add a feature and tag a minor release
+    seed_commits(SEARCH_COMMITS)
+
+    instruction("Tag the new feature release:")
+    show_command('git tag -a v1.1.0 -m "Release v1.1.0: add search module"')
+
+    cmd = expect(lambda cmd: "tag" in cmd and "1.1" in cmd, 'Type: git tag -a v1.1.0 -m "Release v1.1.0: add search module"')
+    play(cmd, "tag", "-a", "v1.1.0", "-m", "Release v1.1.0: add search module", check=has_ref("refs/tags/v1.1.0"))
+    success("v1.1.0 — new minor release tagged!")
+    award_xp(30, "Minor release tagged")
+
+    instruction("See your tags with details:")
+    show_command("git tag -n")
+
+    cmd = expect(lambda cmd: "tag" in cmd, "Type: git tag -n")
+    ok, out = play(cmd, "tag", "-n")
+    print(f"\n  {C.GREEN}{out.replace(chr(10), chr(10) + '  ')}{C.RESET}")
+    success("You can see each release with its description!")
+
+    pause()
+
+# ─── LAB 2: Hotfix Workflow ───
+def level_8_lab_2():
+    clear()
+    banner("LEVEL 8 — LAB 2: HOTFIX — EMERGENCY IN PRODUCTION!")
+    mission("Fix a critical bug using the hotfix workflow.")
+
+    print(f"""
+{C.RED}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  🚨  ALERT: CRITICAL BUG IN PRODUCTION!  🚨     ║
+    ║                                                  ║
+    ║  Users can't log in!                             ║
+    ║  The CEO is on the phone!                        ║
+    ║  Revenue is dropping by the minute!              ║
+    ║                                                  ║
+    ║  You need to fix it NOW.                         ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}
+
+  {C.BOLD}The Hotfix Workflow:{C.RESET}
+
+  1. Branch from main (production code)
+  2. Fix the bug
+  3. Merge back to main
+  4. Tag a patch release (v1.1.1)
+  5. Deploy immediately
+""")
+
+    instruction("Create a hotfix branch:")
+    show_command("git checkout -b hotfix/login-crash")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "hotfix" in cmd, "Type: git checkout -b hotfix/login-crash")
+    play(cmd, "checkout", "-b", "hotfix/login-crash", check=on_branch("hotfix/login-crash"))
+    success("On hotfix branch! Clock is ticking! ⏰")
+
+    instruction("Apply the fix:")
+    show_command('echo "FIX: handle null session token in auth flow" > hotfix-patch.txt')
+
+    expect(lambda cmd: "fix" in cmd.lower() or "hotfix" in cmd.lower() or "patch" in cmd.lower(), 'Type: echo "FIX: handle null session token in auth flow" > hotfix-patch.txt')
+    write_file("hotfix-patch.txt", "FIX: handle null session token in auth flow\nAffected: login, session refresh\nRoot cause: missing null check in token parser\n")
+    success("Fix applied!")
+
+    show_command("git add hotfix-patch.txt")
+    cmd = expect(lambda cmd: "git add" in cmd, "Type: git add hotfix-patch.txt")
+    play(cmd, "add", "hotfix-patch.txt", check=staged("hotfix-patch.txt"))
+
+    show_command('git commit -m "fix: handle null session token in login flow"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "fix: handle null session token in login flow"')
+    play(cmd, "commit", "-m", "fix: handle null session token in login flow", check=head_moved())
+    success("Fix committed!")
+
+    instruction("Merge hotfix back to main:")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+
+    show_command("git merge hotfix/login-crash")
+
+    cmd = expect(lambda cmd: "merge" in cmd, "Type: git merge hotfix/login-crash")
+    ok, out = play(cmd, "merge", "hotfix/login-crash", check=merged("hotfix/login-crash"))
+    success("Hotfix merged to production!")
+
+    instruction("Tag the emergency patch release:")
+    show_command('git tag -a v1.1.1 -m "Hotfix: login crash resolved"')
+
+    cmd = expect(lambda cmd: "tag" in cmd, 'Type: git tag -a v1.1.1 -m "Hotfix: login crash resolved"')
+    play(cmd, "tag", "-a", "v1.1.1", "-m", "Hotfix: login crash resolved", check=has_ref("refs/tags/v1.1.1"))
+    success("v1.1.1 released! Crisis averted! 🎉")
+    award_xp(60, "Hotfix workflow mastered")
+    achievement("Firefighter")
+
+    run_git("branch", "-d", "hotfix/login-crash")
+
+    print(f"""
+  {C.GREEN}
+  ┌──────────────────────────────────────────────────┐
+  │  HOTFIX COMPLETE!                                │
+  │                                                  │
+  │  Timeline:                                       │
+  │  🚨 Bug reported  → 🔧 hotfix/ branch created   │
+  │  → ✅ Fix committed → 🔀 Merged to main         │
+  │  → 🏷️  Tagged v1.1.1 → 🚀 Ready to deploy       │
+  │                                                  │
+  │  Total time: minutes, not hours.                 │
+  │  That's the power of a good workflow.            │
+  └──────────────────────────────────────────────────┘
+  {C.RESET}""")
+
+    pause()
+
+# ─── LAB 3: Final Boss — Complete Sprint ───
+def level_8_lab_3():
+    clear()
+    banner("☠️  FINAL BOSS: THE SPRINT SIMULATION")
+
+    print(f"""
+{C.GOLD}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║  FINAL CHALLENGE: Complete Sprint Workflow       ║
+    ║                                                  ║
+    ║  Do the ENTIRE professional flow:                ║
+    ║                                                  ║
+    ║  1. Create a feature branch                      ║
+    ║  2. Write code with proper commits               ║
+    ║  3. Squash merge to main                         ║
+    ║  4. Tag a major release (v2.0.0)                 ║
+    ║  5. Clean up                                     ║
+    ║                                                  ║
+    ║  Minimal hand-holding. You know this. GO. 💪     ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+    pause("Ready for the final challenge? Press ENTER...")
+
+    clear()
+    banner("SPRINT TASK: Build Settings Module")
+
+    print(f"""
+  {C.BOLD}YOUR MISSION:{C.RESET}
+
+  1. Create branch: {C.CYAN}feature/settings{C.RESET}
+  2. Create file:   {C.CYAN}settings.txt{C.RESET}
+  3. Commit with conventional format
+  4. Squash merge to main
+  5. Tag as {C.CYAN}v2.0.0{C.RESET}
+  6. Delete the branch
+
+  {C.DIM}Less hand-holding this time — you've earned it.{C.RESET}
+""")
+
+    # Step 1
+    instruction("Step 1: Create the feature branch")
+    show_command("git checkout -b feature/settings")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "-b" in cmd, "Type: git checkout -b feature/settings")
+    branch = cmd.split()[-1] if len(cmd.split()) > 3 else "feature/settings"
+    play(cmd, "checkout", "-b", branch, check=on_branch(branch))
+    success("Branch created!")
+
+    # Step 2 & 3
+    instruction("Step 2 & 3: Create settings and commit")
+    show_command('echo "Settings: theme, language, timezone, notifications" > settings.txt')
+
+    expect(lambda cmd: "settings" in cmd.lower(), 'Type: echo "Settings: theme, language, timezone, notifications" > settings.txt')
+    write_file("settings.txt", "Settings Module\n- Theme: light/dark\n- Language: en, es, fr, de, ja\n- Timezone: auto-detect\n- Notification preferences\n- Privacy controls\n")
+    success("File created!")
+
+    show_command("git add settings.txt")
+    cmd = expect(lambda cmd: "add" in cmd, "Type: git add settings.txt")
+    play(cmd, "add", "settings.txt", check=staged("settings.txt"))
+
+    show_command('git commit -m "feat: add settings module with theme, i18n, timezone"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "feat: add settings module with theme, i18n, timezone"')
+    msg = "feat: add settings module with theme, i18n, timezone"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("Committed!")
+
+    # Step 4
+    instruction("Step 4: Squash merge to main")
+    show_command("git checkout main")
+
+    cmd = expect(lambda cmd: "checkout" in cmd and "main" in cmd, "Type: git checkout main")
+    play(cmd, "checkout", "main", check=on_branch("main"))
+
+    show_command("git merge --squash feature/settings")
+
+    cmd = expect(lambda cmd: "merge" in cmd, "Type: git merge --squash feature/settings")
+    play(cmd, "merge", "--squash", "feature/settings", check=lambda: bool(repo_snapshot().staged))
+
+    show_command('git commit -m "feat: add complete settings module"')
+    cmd = expect(lambda cmd: "commit" in cmd, 'Type: git commit -m "feat: add complete settings module"')
+    msg = "feat: add complete settings module"
+    try:
+        msg = cmd.split("-m")[-1].strip().strip('"').strip("'") or msg
+    except:
+        pass
+    play(cmd, "commit", "-m", msg, check=head_moved())
+    success("Squash merged!")
+
+    # Step 5
+    instruction("Step 5: Tag the major release:")
+    show_command('git tag -a v2.0.0 -m "Release v2.0.0: complete platform with settings"')
+
+    cmd = expect(lambda cmd: "tag" in cmd, 'Type: git tag -a v2.0.0 -m "Release v2.0.0: complete platform with settings"')
+    play(cmd, "tag", "-a", "v2.0.0", "-m", "Release v2.0.0: complete platform with settings", check=has_ref("refs/tags/v2.0.0"))
+    success("v2.0.0 tagged!")
+
+    # Step 6
+    instruction("Step 6: Clean up the feature branch")
+    show_command("git branch -D feature/settings")
+
+    cmd = expect(lambda cmd: "branch" in cmd and ("-d" in cmd.lower() or "-D" in cmd), "Type: git branch -D feature/settings")
+    play(cmd, "branch", "-D", "feature/settings", check=lacks_ref("refs/heads/feature/settings"))
+    success("Branch cleaned up!")
+
+    # VICTORY
+    clear()
+    print(f"""
+{C.GREEN}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║        ☠️  FINAL BOSS DEFEATED!  ☠️               ║
+    ║                                                  ║
+    ║   You completed the full professional workflow!  ║
+    ║                                                  ║
+    ║   feature branch → clean commits →               ║
+    ║   squash merge → tag release → clean up          ║
+    ║                                                  ║
+    ║   This is EXACTLY what companies do every day.   ║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}""")
+
+    award_xp(200, "FINAL BOSS — SPRINT COMPLETE!")
+    achievement("Release Manager")
+
+    # Show the complete professional workflow
+    clear()
+    banner("THE COMPLETE PROFESSIONAL GIT WORKFLOW")
+
+    print(f"""
+{C.GOLD}
+  ┌────────────────────────────────────────────────────────┐
+  │                                                        │
+  │   THE PROFESSIONAL DAILY WORKFLOW:                     │
+  │                                                        │
+  │   1. git pull origin main        ← Start of day       │
+  │   2. git checkout -b feature/x   ← New feature        │
+  │   3. ... write code ...          ← Do your thing      │
+  │   4. git add .                   ← Stage changes      │
+  │   5. git commit -m "feat: ..."   ← Conventional msg   │
+  │   6. git merge main              ← Stay current       │
+  │   7. ... fix conflicts if any    ← Resolve            │
+  │   8. git checkout main           ← Switch to main     │
+  │   9. git merge --squash feature  ← Clean merge        │
+  │  10. git commit -m "feat: ..."   ← One clean commit   │
+  │  11. git tag -a v1.x.x           ← If releasing       │
+  │  12. git push origin main        ← Upload             │
+  │  13. git push --tags             ← Upload tags        │
+  │  14. git branch -d feature/x     ← Clean up           │
+  │                                                        │
+  │   THAT'S THE COMPLETE PROFESSIONAL WORKFLOW.           │
+  │                                                        │
+  │   Emergency? hotfix/ branch → fix → merge → tag.      │
+  │   That's it. You know everything.                      │
+  │                                                        │
+  └────────────────────────────────────────────────────────┘
+{C.RESET}""")
+
+    award_xp(100, "PROFESSIONAL WORKFLOW MASTERED!")
+    show_xp()
+
+# ═══════════════════════════════════════════════════════
+# VICTORY SCREEN
+# ═══════════════════════════════════════════════════════
+def victory():
+    if on_alt_screen:
+        leave_alt_screen()      # the final score stays on screen after the game exits
+    else:
+        clear()
+    achievement("Git Master")
+
+    print(f"""
+{C.GOLD}
+    ╔══════════════════════════════════════════════════╗
+    ║                                                  ║
+    ║         🏆  Q U E S T   C O M P L E T E  🏆      ║
+    ║                                                  ║
+    ║         ⭐ FINAL SCORE: {session.xp} XP{' ' * (18 - len(str(session.xp)))}║
+    ║                                                  ║
+    ╚══════════════════════════════════════════════════╝
+{C.RESET}
+
+{C.GREEN}  ACHIEVEMENTS UNLOCKED:{C.RESET}
+""")
+    for a in session.achievements:
+        print(f"  {C.MAGENTA}  🏅 {a}{C.RESET}")
+
+    print(f"""
+{C.BOLD}
+  WHAT YOU MASTERED:
+
+  ✅ Level 1 — git init, add, commit, status, diff, log
+  ✅ Level 2 — restore, amend, reset, .gitignore
+  ✅ Level 3 — branches, merge, conflict resolution
+  ✅ Level 4 — GitHub push, pull, clone, remotes
+  ✅ Level 5 — stash, reflog, recovery, aliases
+  ✅ Level 6 — team workflow, blame, cherry-pick
+  ✅ Level 7 — squash merge, bisect, diff review, PRs
+  ✅ Level 8 — tags, semver, hotfix, release management
+
+  REAL-WORLD SKILLS EARNED:
+
+  🏢 Feature branch workflow      (used at every company)
+  🏢 Conventional commits         (team communication)
+  🏢 Squash merging               (clean history)
+  🏢 Hotfix workflow              (production emergencies)
+  🏢 Semantic versioning          (release management)
+  🏢 Code review prep             (PR best practices)
+
+  WHAT'S NEXT:
+
+  • Use Git in EVERY project from now on
+  • Try github.com — contribute to open source
+  • Look for "good first issue" labels on GitHub
+  • Practice the professional workflow daily
+  • Keep this game — revisit any level anytime!
+{C.RESET}
+
+{C.DIM}  Thank you for playing The Git Quest! ⚔️
+  You went from zero to professional. Go build things.{C.RESET}
+""")
+    save_progress()
+
+# ═══════════════════════════════════════════════════════
+# STRESS DRILLS (python git-quest.py --drill N)
+# ═══════════════════════════════════════════════════════
+DRILL_AUTHORS = ["Sarah <sarah@git-quest.example>", "Ana <ana@git-quest.example>",
+                 "Ben <ben@git-quest.example>", "Chen <chen@git-quest.example>"]
+DRILL_LEDGER_LINES = 100
+DRILL_SIZES = (1000, 10000, 100000)
+
+# Test script for `git bisect run`: exit 0 = good, 1 = bad.
+BISECT_CHECK = """import os, sys
+if not os.path.exists("app.txt"):
+    sys.exit(0)     # older than the app, so older than the bug
+with open("app.txt") as f:
+    sys.exit(1 if "BUG" in f.read() else 0)
+"""
+
+def write_bisect_check(git_dir):
+    """Write the app.txt check into `git_dir` (out of the worktree's way). Returns its path."""
+    path = os.path.join(git_dir, "check_app.py")
+    with open(path, "w") as f:
+        f.write(BISECT_CHECK)
+    return path
+
+def drill_bad_commit(n):
+    """1-based index of the commit that introduces the drill's bug."""
+    return n * 5 // 8 + 1
+
+def drill_history_stream(n):
+    """fast-import stream for an n-commit linear history.
+
+    Every commit bumps app.txt, whose status turns to BUG from
+    drill_bad_commit(n) on. About a hundred of them also rewrite one line
+    of ledger.txt, so blame has to walk the whole history.
+    """
+    bad = drill_bad_commit(n)
+    every = max(1, n // DRILL_LEDGER_LINES)
+    ledger = [f"{i:03d} opened by {DRILL_AUTHORS[0].split()[0]}" for i in range(DRILL_LEDGER_LINES)]
+    stream = []
+    edits = 0
+    for i in range(1, n + 1):
+        author = DRILL_AUTHORS[i % len(DRILL_AUTHORS)]
+        ident = f"{author} {SEED_EPOCH + 60 * i} +0000"
+        stream.append(f"commit refs/heads/main\nauthor {ident}\ncommitter {ident}\n")
+        stream.append(fast_import_data(f"build {i}"))
+        status = "BUG" if i >= bad else "OK"
+        stream.append("M 100644 inline app.txt\n")
+        stream.append(fast_import_data(f"App build {i}\nstatus: {status}"))
+        if i == 1 or i % every == 0:
+            line = (edits * 37) % DRILL_LEDGER_LINES
+            edits += 1
+            ledger[line] = f"{line:03d} touched in build {i} by {author.split()[0]}"
+            stream.append("M 100644 inline ledger.txt\n")
+            stream.append(fast_import_data("\n".join(ledger)))
+        stream.append("\n")
+    stream.append("done\n")
+    return "".join(stream)
+
+def build_drill_repo(n):
+    """Create (or reuse) the n-commit drill repo. Returns its path, or None on failure."""
+    path = os.path.join(DRILL_DIR, f"history-{n}")
+    if os.path.isfile(os.path.join(path, "ledger.txt")):
+        return path
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    run_git("init", "--quiet", "--initial-branch=main", cwd=path, env=SEED_ENV)
+    relax_fsync(path)
+    ok, out = run_git("fast-import", "--quiet", "--done", cwd=path, env=SEED_ENV,
+                      input=drill_history_stream(n), timeout=600)
+    if not ok:
+        fail(f"Couldn't build the drill history: {out}")
+        return None
+    run_git("checkout", "--quiet", "--force", "main", cwd=path, env=SEED_ENV)
+    return path
+
+def drill_bisect(path, n):
+    """Auto-bisect the drill repo, timing every step. Returns the number of steps taken."""
+    ok, root = run_git("rev-list", "--max-parents=0", "HEAD", cwd=path)
+    run_git("bisect", "reset", cwd=path)
+    ok, out = run_git("bisect", "start", "HEAD", root, cwd=path)
+    max_steps = math.ceil(math.log2(n)) + 2
+    steps = 0
+    started = time.perf_counter()
+    while ok and steps < max_steps:
+        with open(os.path.join(path, "app.txt")) as f:
+            build, status = f.read().strip().split("\n")
+        verdict = "bad" if "BUG" in status else "good"
+        step_started = time.perf_counter()
+        ok, out = run_git("bisect", verdict, cwd=path)
+        steps += 1
+        color = C.RED if verdict == "bad" else C.GREEN
+        print(f"    {color}Step {steps:2d}: {build:<18} {status:<12} → {verdict.upper():<4}{C.RESET}"
+              f" {C.DIM}{(time.perf_counter() - step_started) * 1000:6.1f} ms{C.RESET}")
+        sys.stdout.flush()
+        if "is the first bad commit" in out:
+            first_line = out.split("\n")[0]
+            print(f"\n  {C.GREEN}{first_line}{C.RESET}")
+            break
+    elapsed = time.perf_counter() - started
+    run_git("bisect", "reset", cwd=path)
+    print(f"\n  {C.BOLD}{steps} checks in {elapsed:.2f}s.{C.RESET} Checking commits one by one could take "
+          f"{C.RED}{n:,}{C.RESET}; log2({n:,}) ≈ {C.GREEN}{math.log2(n):.1f}{C.RESET}.")
+    return steps
+
+def drill_bisect_run(path):
+    """Time the whole hunt as one `git bisect run`. Returns (seconds, commits tested)."""
+    script = write_bisect_check(os.path.join(path, ".git"))
+    ok, root = run_git("rev-list", "--max-parents=0", "HEAD", cwd=path)
+    run_git("bisect", "start", "HEAD", root, cwd=path)
+    started = time.perf_counter()
+    ok, out = run_git("bisect", "run", sys.executable, script, cwd=path, timeout=600)
+    elapsed = time.perf_counter() - started
+    run_git("bisect", "reset", cwd=path)
+    return elapsed, out.count("running ")
+
+def drill_parallel_bisect(path, jobs):
+    """k-ary bisect: each round tests `jobs` evenly spaced commits at once, one per worktree.
+
+    Each round cuts the range into jobs + 1 parts instead of two, so it
+    takes log(n) / log(jobs + 1) rounds. Returns (seconds, rounds, first
+    bad commit id).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    script = write_bisect_check(os.path.join(path, ".git"))
+    ok, out = run_git("rev-list", "--reverse", "HEAD", cwd=path, timeout=600)
+    commits = out.split("\n")
+    worktrees = [os.path.join(DRILL_DIR, f"{os.path.basename(path)}-worktree-{i}") for i in range(jobs)]
+    run_git("worktree", "prune", cwd=path)
+    for worktree in worktrees:
+        if not os.path.isdir(worktree):
+            run_git("worktree", "add", "--detach", "--quiet", worktree, commits[0], cwd=path)
+
+    def is_good(worktree, commit):
+        run_git("checkout", "--detach", "--quiet", commit, cwd=worktree)
+        count(subprocesses=1)
+        return subprocess.run([sys.executable, script], cwd=worktree).returncode == 0
+
+    good, bad = 0, len(commits) - 1     # indexes: oldest commit works, newest is broken
+    rounds = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(jobs) as pool:
+        while bad - good > 1:
+            picks = sorted(set(good + (bad - good) * (j + 1) // (jobs + 1) for j in range(jobs)) - {good, bad})
+            results = list(pool.map(is_good, worktrees, [commits[i] for i in picks]))
+            for i, ok in zip(picks, results):
+                if not ok:
+                    bad = i
+                    break
+                good = i
+            rounds += 1
+    elapsed = time.perf_counter() - started
+    for worktree in worktrees:
+        run_git("worktree", "remove", "--force", worktree, cwd=path)
+    return elapsed, rounds, commits[bad]
+
+def drill_blame(path):
+    """Time `git blame` on the ledger, which was edited across the whole history."""
+    started = time.perf_counter()
+    ok, out = run_git("blame", "-s", "ledger.txt", cwd=path, timeout=600)
+    elapsed = time.perf_counter() - started
+    lines = out.split("\n") if ok else []
+    for line in lines[:5]:
+        print(f"    {C.DIM}{line}{C.RESET}")
+    commits = set(line.split()[0] for line in lines if line)
+    print(f"\n  {C.BOLD}Blamed {len(lines)} lines to {len(commits)} commits in {elapsed:.2f}s.{C.RESET}")
+
+def stress_drill(n, jobs=0):
+    """Bisect and blame drills against an n-commit history; `jobs` > 1 adds the parallel bisect race."""
+    clear()
+    banner(f"STRESS DRILL: {n:,} COMMITS")
+    story(f"A monorepo with {n:,} commits. One of them broke the app.")
+    print(f"  {C.DIM}Building the history...{C.RESET}")
+    sys.stdout.flush()
+    started = time.perf_counter()
+    path = build_drill_repo(n)
+    if not path:
+        return
+    print(f"  {C.DIM}History ready in {time.perf_counter() - started:.2f}s ({path}){C.RESET}\n")
+
+    instruction("Binary search with git bisect:")
+    drill_bisect(path, n)
+
+    instruction("Now let a script do it: git bisect run")
+    serial, tested = drill_bisect_run(path)
+    print(f"  {C.BOLD}git bisect run tested {tested} commits in {serial:.2f}s.{C.RESET}")
+    if jobs > 1:
+        instruction(f"Parallel bisect: {jobs} commits per round, one worktree each:")
+        parallel, rounds, found = drill_parallel_bisect(path, jobs)
+        print(f"  {C.BOLD}{rounds} rounds in {parallel:.2f}s{C.RESET} {C.DIM}(found {found[:12]}){C.RESET}"
+              f" — {C.GREEN if parallel < serial else C.RED}{serial / parallel:.1f}x{C.RESET} the speed of git bisect run.")
+        print(f"  {C.DIM}The slower the test, the more the parallel rounds pay off.{C.RESET}")
+    instruction("Who last touched each line? git blame:")
+    drill_blame(path)
+
+# ═══════════════════════════════════════════════════════
+# LEVEL TABLE
+# ═══════════════════════════════════════════════════════
+# Each level is a list of steps; the saved lab cursor indexes into it.
+LEVELS = {
+    1: [level_1_intro, level_1_lab_1, level_1_lab_2, level_1_lab_3, level_1_lab_4, level_1_complete],
+    2: [level_2_intro, level_2_lab_1, level_2_lab_2, level_2_lab_3, level_2_lab_4, level_2_lab_5,
+        level_2_lab_6, level_2_complete],
+    3: [level_3_intro, level_3_lab_1, level_3_lab_2, level_3_lab_3, level_3_lab_4],
+    4: [level_4_intro, level_4_complete],
+    5: [level_5_intro, level_5_lab_1, level_5_lab_2, level_5_lab_3, level_5_lab_4, level_5_lab_5,
+        level_5_complete],
+    6: [level_6_intro, level_6_lab_1, level_6_lab_2, level_6_lab_3, level_6_lab_4, level_6_lab_5,
+        level_6_complete],
+    7: [level_7_intro, level_7_lab_1, level_7_lab_2, level_7_lab_3, level_7_lab_4, level_7_complete],
+    8: [level_8_intro, level_8_lab_1, level_8_lab_2, level_8_lab_3],
+}
+
+# The scripted history each step seeds, for the prefetcher to build ahead of time.
+FIXTURES = {
+    level_6_lab_2: (SARAH_MAIN_COMMITS, SARAH),
+    level_6_lab_5: (SARAH_BRANCH_COMMITS, SARAH),
+    level_7_lab_1: (MESSY_COMMITS, SEED_AUTHOR),
+    level_7_lab_2: (BISECT_COMMITS, SEED_AUTHOR),
+    level_7_lab_3: (REWRITE_COMMITS, SEED_AUTHOR),
+    level_7_lab_4: (NOTIFICATION_COMMITS, SEED_AUTHOR),
+    level_8_lab_1: (SEARCH_COMMITS, SEED_AUTHOR),
+}
+
+# ═══════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════
+def main(started=None):
+    parser = argparse.ArgumentParser(description="The Git Quest - learn Git by doing.")
+    parser.add_argument("--replay", metavar="TRANSCRIPT",
+                        help="play headless, answering every prompt from a JSONL transcript")
+    parser.add_argument("--stats", metavar="FILE",
+                        help="with --replay, also write the per-lab stats to FILE as JSON")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="draw the menu once, print how long that took and exit")
+    parser.add_argument("--fast", action="store_true",
+                        help="fast text: print story text at once and skip the dramatic pauses")
+    parser.add_argument("--drill", type=int, metavar="N",
+                        help=f"bisect and blame drills on an N-commit history (e.g. {', '.join(map(str, DRILL_SIZES))})")
+    parser.add_argument("--parallel", type=int, default=0, metavar="K",
+                        help="with --drill, also race a K-way parallel bisect against git bisect run")
+    parser.add_argument("--real", action="store_true",
+                        help="run the git commands you type exactly as typed in the quest repo")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="append each lab's timings and counters to FILE as JSON lines")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile each lab into DIR (cProfile dumps and flame graph stacks) and print the top functions")
+    parser.add_argument("--ram", action="store_true",
+                        help="keep quest repos in RAM (/dev/shm) and export yours to ./git-quest on exit")
+    args = parser.parse_args()
+
+    global fast_text, real_mode, upcoming, quest_root
+    fast_text = args.fast or bool(args.replay)
+    real_mode = args.real
+    enable_ansi()
+    buffer_screen_output()
+    ensure_git_config()
+
+    if args.startup_time:
+        load_progress()
+        draw_main_menu()
+        if started is not None:
+            print(f"  Menu drawn {(time.perf_counter() - started) * 1000:.1f} ms after launch")
+        print(f"  {time.process_time() * 1000:.1f} ms CPU since the interpreter started")
+        return
+    if args.drill:
+        if args.drill < 2:
+            parser.error("--drill needs at least 2 commits")
+        stress_drill(args.drill, args.parallel)
+        return
+    if args.trace:
+        start_trace(args.trace)
+    if args.profile:
+        start_profile(args.profile)
+    if args.ram:
+        quest_root = ram_dir()
+        import_quest_repo()
+        atexit.register(export_quest_repo)   # before the alt screen, so it prints after leaving it
+    if args.replay:
+        load_replay(args.replay)
+    else:
+        use_alt_screen()
+
+    # Show menu
+    action, start_level = main_menu()
+
+    if action == "new":
+        title_screen()
+        start_level = 1
+
+    # Only "continue" resumes mid-level; a level picked from the menu starts at its intro
+    start_lab = session.current_lab if action == "continue" else 0
+
+    # A finished level picked from the menu is replayed in a sandbox, so the
+    # main quest repo stays exactly where the player left it.
+    replaying = action == "select" and start_level < session.current_level
+    if replaying:
+        session.quest_dir = open_sandbox("replay", f"level-{start_level - 1}")
+
+    # Setup quest directory if starting past the first lab
+    elif start_level > 1 or start_lab > 0:
+        session.quest_dir = quest_path("git-quest")
+        if start_lab > 0 and os.path.exists(checkpoint_head_file("resume")):
+            shutil.rmtree(session.quest_dir, ignore_errors=True)
+            restore_checkpoint("resume")
+        if not os.path.exists(session.quest_dir):
+            os.makedirs(session.quest_dir, exist_ok=True)
+        if not is_git_repo():
+            restore_checkpoint(f"level-{start_level - 1}")
+
+    if start_level == 1 and start_lab > 0 and not read_head()[1]:
+        # Nothing to resume Level 1 from: redo it from the lab that creates
+        # the repo, so its `git log` lessons show only the player's commits
+        start_lab = min(start_lab, LEVELS[1].index(level_1_lab_2))
+    elif start_level > 1 and not read_head()[1]:
+        run_git("init", "--initial-branch=main")
+        write_file("hero.txt", "Hero - Git Quest Player\n")
+        run_git("add", ".")
+        run_git("commit", "-m", "Quest checkpoint")
+
+    # Run labs from the saved cursor onward. Progress is saved after every
+    # lab of the player's frontier level, with the repo checkpointed alongside it,
+    # so quitting mid-level resumes at the next lab instead of the intro.
+    # Each step's pauses also prefetch the history the step after it seeds.
+    # A replayed level is played on its own and never checkpointed: the
+    # sandbox is not the player's repo.
+    last_level = start_level if replaying else 8
+    for lvl in range(start_level, last_level + 1):
+        steps = LEVELS[lvl]
+        frontier = lvl == session.current_level
+        for i in range(start_lab, len(steps)):
+            upcoming = FIXTURES.get(steps[i + 1]) if i + 1 < len(steps) else None
+            steps[i]()
+            if frontier and i + 1 < len(steps):
+                session.current_lab = i + 1
+                save_checkpoint("resume")
+            save_progress()
+        start_lab = 0
+        if frontier:
+            session.current_level = lvl + 1
+            session.current_lab = 0
+        save_progress()
+        if not replaying:
+            save_checkpoint(f"level-{lvl}")
+            prune_checkpoints()
+
+    if replaying:
+        close_sandbox(session.quest_dir)
+        leave_alt_screen()
+        print(f"\n  {C.GREEN}Level {start_level} replayed. Your quest repo is just as you left it.{C.RESET}")
+    else:
+        victory()
+
+    if replay_inputs is not None:
+        finish_lab_stats()
+        report_lab_stats()
+        if args.stats:
+            write_lab_stats(args.stats)
+
+if __name__ == "__main__":
+    main()